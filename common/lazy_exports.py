@@ -0,0 +1,33 @@
+"""
+Lazily-resolved package exports for StoryLand AI.
+
+A package maps each exported name to the submodule defining it; the
+submodule is imported on first attribute access (PEP 562), so importing
+the package stays cheap until an export is actually used.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ that imports exports on first access.
+
+    Args:
+        package: The package's __name__
+        exports: Exported name -> relative submodule defining it
+                 (e.g. {"ContextManager": ".context_manager"})
+
+    Returns:
+        Function to assign to the package's __getattr__
+    """
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name], package), name)
+            setattr(sys.modules[package], name, value)  # Later lookups skip __getattr__
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
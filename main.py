@@ -534,10 +534,10 @@ Examples:
     # Preference arguments
     parser.add_argument("--budget", choices=["budget", "moderate", "luxury"])
     parser.add_argument("--pace", choices=["relaxed", "moderate", "fast-paced"])
-    parser.add_argument("--museums", action="store_true", dest="prefers_museums")
-    parser.add_argument("--no-museums", action="store_false", dest="prefers_museums")
+    parser.add_argument(
+        "--museums", action=argparse.BooleanOptionalAction, dest="prefers_museums"
+    )
     parser.add_argument("--with-kids", action="store_true")
-    parser.set_defaults(prefers_museums=None)
 
     args = parser.parse_args()
 
@@ -6,10 +6,15 @@ This package contains service factories for:
 - Context management (token optimization)
 """
 
-from .session_service import create_session_service
-from .context_manager import ContextManager
+from common.lazy_exports import lazy_exports
 
 __all__ = [
     "create_session_service",
     "ContextManager",
 ]
+
+# Importing ContextManager does not load ADK's session services
+__getattr__ = lazy_exports(__name__, {
+    "create_session_service": ".session_service",
+    "ContextManager": ".context_manager",
+})
@@ -7,9 +7,59 @@ Provides strategies for keeping conversations within token budgets through:
 - Hybrid approach (recent events + relevant memories)
 """
 
-from typing import List, Optional
-from google.adk.sessions import Session
-from google.genai import types
+import functools
+from array import array
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+
+
+def _iter_texts(events):
+    """Yield the non-empty text of every content part in events."""
+    for event in events:
+        # Look each attribute up once per event; content is Content | None and
+        # parts is list[Part] | None, so no truthiness check on content
+        content = event.content
+        if content is None:
+            continue
+        parts = content.parts
+        if not parts:  # None or []
+            continue
+        for part in parts:
+            if text := getattr(part, "text", None):
+                yield text
+
+
+@functools.cache
+def _enc():
+    """
+    Load the tiktoken encoder once.
+
+    Returns None when tiktoken is not installed (or its encoding cannot be
+    loaded), in which case tokens are estimated at ~4 chars per token.
+    """
+    try:
+        from tiktoken import get_encoding
+        return get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def _count_tokens(texts) -> int:
+    """Number of tiktoken tokens in texts (0 when no encoder is available)."""
+    enc = _enc()
+    if enc is None:
+        return 0
+    return sum(len(enc.encode(text, disallowed_special=())) for text in texts)
+
+
+def _event_counts(event) -> tuple[int, int]:
+    """(chars, tokens) of the text parts of a single event."""
+    texts = list(_iter_texts((event,)))
+    return sum(map(len, texts)), _count_tokens(texts)
 
 
 class ContextManager:
@@ -22,6 +72,18 @@ class ContextManager:
     3. Hybrid: Recent events + relevant memory search results
     """
 
+    __slots__ = (
+        "max_events",
+        "max_tokens",
+        "preserve_system",
+        "_buf",
+        "_char_counts",
+        "_token_counts",
+        "_total_chars",
+        "_total_tokens",
+        "_stats_cache",
+    )
+
     def __init__(
         self,
         max_events: int = 20,
@@ -40,6 +102,59 @@ class ContextManager:
         self.max_tokens = max_tokens
         self.preserve_system = preserve_system
 
+        # Fixed-size window of recent events; the deque evicts the oldest
+        # event on append once max_events is reached.
+        self._buf = deque(maxlen=max_events or None)
+        # Char and token counts of each buffered event, kept in lockstep
+        # with _buf, plus their running totals, so window stats never touch
+        # an event object.
+        self._char_counts = deque(maxlen=max_events or None)
+        self._token_counts = deque(maxlen=max_events or None)
+        self._total_chars = 0
+        self._total_tokens = 0
+
+        # Last list scanned by get_context_stats(). If the same list has only
+        # been appended to since, the next call scans just the new tail.
+        self._stats_cache = {
+            "events_id": None, "len": 0, "chars": 0, "tokens": 0, "last_ref": None
+        }
+
+    def append_event(self, event: "Event") -> None:
+        """
+        Append an event to the managed sliding window.
+
+        Once max_events events are held, the oldest event is dropped
+        automatically, so the window never needs an explicit truncation.
+
+        Args:
+            event: Session event to record
+
+        Example:
+            >>> context_manager = ContextManager(max_events=20)
+            >>> async for event in runner.run_async(...):
+            ...     context_manager.append_event(event)
+        """
+        chars, tokens = _event_counts(event)
+        if len(self._buf) == self._buf.maxlen:
+            # The append below evicts the oldest event
+            self._total_chars -= self._char_counts.popleft()
+            self._total_tokens -= self._token_counts.popleft()
+        self._buf.append(event)
+        self._char_counts.append(chars)
+        self._token_counts.append(tokens)
+        self._total_chars += chars
+        self._total_tokens += tokens
+
+    def recent_events(self) -> deque:
+        """
+        Get the events currently held in the sliding window.
+
+        Returns:
+            Deque of events, oldest first (at most max_events long).
+            Use list(...) if a list is required.
+        """
+        return self._buf
+
     def limit_events(self, events: List, num_recent: int = 20) -> List:
         """
         Simple sliding window: Keep only recent N events.
@@ -59,14 +174,45 @@ class ContextManager:
             return events
 
         # Keep the most recent events
-        return events[-num_recent:]
+        return list(self.iter_recent(events, num_recent))
 
-    def get_context_stats(self, events: List) -> dict:
+    def iter_recent(self, events, num_recent: int = 20):
+        """
+        Iterate over the most recent N events without copying them.
+
+        Single-pass alternative to limit_events() for callers that only loop
+        over the result once; use limit_events() if a list is needed.
+
+        Args:
+            events: Sequence of session events (list, deque, ...)
+            num_recent: Number of recent events to yield
+
+        Yields:
+            The last num_recent events, oldest first
+
+        Example:
+            >>> for event in context_manager.iter_recent(session.events, 15):
+            ...     print(event.author)
+        """
+        if len(events) <= num_recent:
+            yield from events
+        else:
+            yield from islice(events, len(events) - num_recent, None)
+
+    def get_context_stats(self, events: Optional[List] = None) -> dict:
         """
         Get statistics about the current context.
 
+        Repeated calls with the same list object only measure events
+        appended since the previous call. This assumes the list is
+        append-only: replacing an earlier element in place is not detected
+        (pass a new list to force a full scan). A session re-read with
+        get_session() has a new events list and is always scanned in full.
+
         Args:
-            events: List of session events
+            events: List of session events. If omitted, stats are reported
+                    for the managed window (see append_event) from running
+                    counters, without scanning any events.
 
         Returns:
             Dictionary with context statistics
@@ -75,22 +221,96 @@ class ContextManager:
             >>> stats = context_manager.get_context_stats(session.events)
             >>> print(f"Events: {stats['num_events']}")
         """
+        if events is None:
+            return self._build_stats(
+                len(self._buf), self._total_chars, self._total_tokens
+            )
+
         num_events = len(events)
 
-        # Estimate tokens (rough approximation: 4 chars per token)
-        total_chars = 0
-        for event in events:
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, "text") and part.text:
-                        total_chars += len(part.text)
+        # Resume from the cached count when this is the same list, unchanged
+        # up to the last event we saw; otherwise rescan from the start.
+        cache = self._stats_cache
+        cached_len = cache["len"]
+        if (
+            cache["events_id"] == id(events)
+            and cached_len <= num_events
+            and (cached_len == 0 or events[cached_len - 1] is cache["last_ref"])
+        ):
+            start, total_chars, total_tokens = cached_len, cache["chars"], cache["tokens"]
+        else:
+            start, total_chars, total_tokens = 0, 0, 0
+
+        # Only the new tail is measured (and tokenized)
+        if start:
+            events_tail = (
+                events[start:] if isinstance(events, list) else islice(events, start, None)
+            )
+        else:
+            events_tail = events
+        texts = list(_iter_texts(events_tail))
+        total_chars += sum(map(len, texts))
+        total_tokens += _count_tokens(texts)
+
+        cache["events_id"] = id(events)
+        cache["len"] = num_events
+        cache["chars"] = total_chars
+        cache["tokens"] = total_tokens
+        cache["last_ref"] = events[-1] if num_events else None
+
+        return self._build_stats(num_events, total_chars, total_tokens)
+
+    def get_context_stats_batch(self, sessions) -> dict[str, array]:
+        """
+        Get context statistics for many sessions in one call.
+
+        Results are column arrays aligned with sessions, ready for vectorized
+        reductions (e.g. numpy.frombuffer). Each session's events are scanned
+        in full; the incremental cache used by get_context_stats() is left
+        untouched.
+
+        Args:
+            sessions: Sequence of sessions (anything with an events list)
 
-        estimated_tokens = total_chars // 4
+        Returns:
+            Dictionary of array('i') columns: num_events, total_chars and
+            estimated_tokens, with one entry per session
+
+        Example:
+            >>> batch = context_manager.get_context_stats_batch(sessions)
+            >>> print(f"Total tokens: {sum(batch['estimated_tokens'])}")
+        """
+        count = len(sessions)
+        num_events = array("i", [0]) * count
+        total_chars = array("i", [0]) * count
+        estimated_tokens = array("i", [0]) * count
+        use_tokenizer = _enc() is not None
+
+        for i, session in enumerate(sessions):
+            events = session.events
+            texts = list(_iter_texts(events))
+            chars = sum(map(len, texts))
+            num_events[i] = len(events)
+            total_chars[i] = chars
+            estimated_tokens[i] = _count_tokens(texts) if use_tokenizer else chars >> 2
 
         return {
             "num_events": num_events,
             "total_chars": total_chars,
             "estimated_tokens": estimated_tokens,
+        }
+
+    def _build_stats(
+        self, num_events: int, total_chars: Optional[int], total_tokens: Optional[int]
+    ) -> dict:
+        """Build the stats dictionary returned by get_context_stats() and check()."""
+        if total_chars is not None and _enc() is None:
+            # No tokenizer: rough approximation of 4 chars per token
+            total_tokens = total_chars >> 2
+        return {
+            "num_events": num_events,
+            "total_chars": total_chars,
+            "estimated_tokens": total_tokens,
             "within_limit": (
                 num_events <= self.max_events
                 if self.max_events
@@ -121,6 +341,36 @@ class ContextManager:
 
         return False
 
+    def check(self, events: List) -> tuple[bool, dict]:
+        """
+        Decide whether to compact and report stats in a single pass.
+
+        Use this instead of calling should_compact() and get_context_stats()
+        separately. When the event count alone exceeds max_events, no text
+        is measured and total_chars / estimated_tokens are None.
+
+        Args:
+            events: List of session events
+
+        Returns:
+            Tuple of (should_compact, stats), where stats has the same keys
+            as get_context_stats()
+
+        Example:
+            >>> compact, stats = context_manager.check(session.events)
+            >>> logger.info("context_checked", **stats)
+            >>> if compact:
+            ...     session.events = context_manager.limit_events(session.events)
+        """
+        num_events = len(events)
+        if self.max_events and num_events > self.max_events:
+            return True, self._build_stats(num_events, None, None)
+
+        stats = self.get_context_stats(events)
+        if self.max_tokens:
+            return stats["estimated_tokens"] > self.max_tokens, stats
+        return False, stats
+
 
 # Example usage patterns:
 
@@ -133,6 +383,17 @@ class ContextManager:
 #     session.events = context_manager.limit_events(session.events, num_recent=15)
 
 
+# Pattern 1b: Managed circular buffer
+# -----------------------------------
+# context_manager = ContextManager(max_events=20)
+#
+# async for event in runner.run_async(...):
+#     context_manager.append_event(event)  # oldest event evicted automatically
+#
+# for event in context_manager.recent_events():
+#     ...
+
+
 # Pattern 2: Using GetSessionConfig (ADK built-in)
 # ------------------------------------------------
 # from google.adk.sessions import GetSessionConfig
@@ -5,10 +5,13 @@ Provides factory functions for creating session services with SQLite or
 in-memory backends.
 """
 
+import functools
 import os
 from typing import Optional
 
-from google.adk.sessions import InMemorySessionService, DatabaseSessionService
+from common.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 def create_session_service(
@@ -24,7 +27,9 @@ def create_session_service(
         use_database: If True, use DatabaseSessionService; otherwise InMemorySessionService
 
     Returns:
-        Session service instance (InMemorySessionService or DatabaseSessionService)
+        Session service instance (InMemorySessionService or DatabaseSessionService).
+        Instances are cached per configuration, so repeated calls share one
+        service (and its stored sessions / connection pool).
 
     Examples:
         # Development: In-memory (default)
@@ -45,25 +50,73 @@ def create_session_service(
         ...     use_database=True
         ... )
     """
+    if use_database and not connection_string:
+        # Default to SQLite in the current directory
+        connection_string = "sqlite:///storyland_sessions.db"
+
+    # Normalize the cache key: the connection string only matters for the
+    # database backend.
+    return _cached_session_service(
+        connection_string if use_database else None, use_database
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_session_service(connection_string: Optional[str], use_database: bool):
+    """Build one session service per (connection_string, use_database)."""
+    # ADK's session services (and SQLAlchemy behind the database one) are
+    # imported on first use rather than when this module is imported.
     if use_database:
         # Production: Database-backed session service
-        if not connection_string:
-            # Default to SQLite in the current directory
-            connection_string = "sqlite:///storyland_sessions.db"
+        from google.adk.sessions import DatabaseSessionService
 
-        print(f"Using DatabaseSessionService with: {connection_string}")
+        logger.info(
+            "session_service_created",
+            backend="DatabaseSessionService",
+            db_url=connection_string,
+        )
         return DatabaseSessionService(db_url=connection_string)
     else:
         # Development: In-memory session service
-        print("Using InMemorySessionService (not persistent)")
+        from google.adk.sessions import InMemorySessionService
+
+        logger.info(
+            "session_service_created",
+            backend="InMemorySessionService",
+            persistent=False,
+        )
         return InMemorySessionService()
 
 
+# (use_database, connection_string) parsed from the environment on first use;
+# reset by reload_env().
+_CACHED_CFG: Optional[tuple[bool, Optional[str]]] = None
+
+
+def reload_env() -> tuple[bool, Optional[str]]:
+    """
+    Re-read USE_DATABASE and DATABASE_URL from the environment.
+
+    create_session_service_from_env() parses the environment once and reuses
+    the result. Call this after changing those variables (e.g. in tests, or
+    from a SIGHUP handler) to pick up the new values.
+
+    Returns:
+        Tuple of (use_database, connection_string)
+    """
+    global _CACHED_CFG
+    _CACHED_CFG = (
+        os.getenv("USE_DATABASE", "false").lower() == "true",
+        os.getenv("DATABASE_URL"),
+    )
+    return _CACHED_CFG
+
+
 def create_session_service_from_env():
     """
     Create session service based on environment variables.
 
-    Reads from:
+    Reads from (parsed on first call; see reload_env()):
         - DATABASE_URL: Connection string for database
         - USE_DATABASE: "true" or "false" to enable database sessions
 
@@ -77,8 +130,7 @@ def create_session_service_from_env():
 
         >>> session_service = create_session_service_from_env()
     """
-    use_database = os.getenv("USE_DATABASE", "false").lower() == "true"
-    connection_string = os.getenv("DATABASE_URL")
+    use_database, connection_string = _CACHED_CFG or reload_env()
 
     return create_session_service(
         connection_string=connection_string, use_database=use_database
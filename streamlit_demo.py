@@ -9,11 +9,15 @@ Usage:
 
 import asyncio
 import json
+import threading
+import time
 import uuid
-from typing import Optional, List
+from typing import NamedTuple, Optional, List
 
+import requests
 import streamlit as st
 from google.genai import types
+from google.adk.events import Event, EventActions
 from google.adk.models.google_llm import Gemini
 from google.adk.runners import Runner
 from google.adk.plugins.logging_plugin import LoggingPlugin
@@ -28,6 +32,240 @@ from agents.orchestrator import (
     create_composition_workflow,
 )
 
+try:
+    import uvloop  # Optional: faster event loop (not available on Windows)
+except ImportError:
+    uvloop = None
+
+
+# Prefix of the per-browser user ids (see main); user: state such as
+# user:preferences is keyed by user id, so visitors must not share one
+USER_ID = "streamlit_demo"
+
+# Set once configure_logging() has run in this process
+_LOGGING_CONFIGURED = False
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Icon and display label for each itinerary stop type
+_STOP_ICONS = {
+    "landmark": "🏛️",
+    "museum": "🏛️",
+    "author_site": "✍️",
+    "restaurant": "🍽️",
+    "cafe": "☕",
+    "bookstore": "📚",
+    "other": "📍"
+}
+_STOP_LABELS = {stop_type: stop_type.replace("_", " ").title() for stop_type in _STOP_ICONS}
+
+# Welcome screen shown before a book has been entered
+_WELCOME_MD = """
+### Welcome to StoryLand AI!
+
+Transform your favorite books into real travel experiences. Here's how it works:
+
+1. **📚 Enter a book title** - Tell us which book you'd like to explore
+2. **⚙️ Set your preferences** - Budget, pace, and travel style
+3. **🌍 Choose regions** - Select which geographic areas you want to visit
+4. **🗺️ Get your itinerary** - Receive a detailed, personalized travel plan
+
+### Features:
+- **AI-powered research** - Discovers locations tied to book settings, author sites, and themes
+- **Geographic grouping** - Regions organized for practical travel planning
+- **Personalized itineraries** - Tailored to your budget and travel preferences
+- **Detailed stops** - Each location includes context, timing, and tips
+
+**Ready to start?** Enter a book title in the sidebar and click "Create Itinerary"!
+
+### Example Books:
+- Pride and Prejudice by Jane Austen
+- The Great Gatsby by F. Scott Fitzgerald
+- 1984 by George Orwell
+- The Nightingale by Kristin Hannah
+"""
+
+
+class TraceEvent(NamedTuple):
+    """One agent event in the execution trace."""
+
+    phase: str
+    agent: str
+    timestamp: str
+
+
+# Live trace updates are batched: redraw every N new lines or after this
+# many seconds, whichever comes first.
+TRACE_FLUSH_EVERY = 4
+TRACE_FLUSH_INTERVAL = 0.1
+
+
+@st.cache_resource
+def _get_config():
+    """Application config, loaded once per process."""
+    return load_config()
+
+
+def _get_logger():
+    """Configure logging on first use and return the demo's logger."""
+    global _LOGGING_CONFIGURED
+    if not _LOGGING_CONFIGURED:
+        configure_logging(level="INFO", enable_adk_debug=False)
+        _LOGGING_CONFIGURED = True
+    return get_logger("storyland.streamlit")
+
+
+def _create_model(config):
+    """Build the Gemini model for one workflow run.
+
+    Not cached: each phase runs in its own _run_async() loop and the genai
+    client's async connection pool must not outlive its loop.
+    """
+    retry_config = types.HttpRetryOptions(
+        attempts=5, exp_base=7, initial_delay=1, http_status_codes=[429, 500, 503, 504]
+    )
+    return Gemini(
+        model=config.model_name, api_key=config.google_api_key, retry_options=retry_config
+    )
+
+
+def _parse_json_object(text: str) -> Optional[dict]:
+    """Parse the first JSON object embedded in text (e.g. inside a code fence).
+
+    Decodes in place from the first "{" and stops at the end of that object,
+    so no substring copy of the response is made.
+
+    Raises:
+        json.JSONDecodeError: If the text after the first "{" is not valid JSON
+    """
+    json_start = text.find("{")
+    if json_start < 0:
+        return None
+    result, _ = _JSON_DECODER.raw_decode(text, json_start)
+    return result
+
+
+def _itinerary_totals(cities_list: List[dict]) -> tuple:
+    """Return (cities, days, stops) totals for an itinerary in one pass."""
+    total_cities = total_days = total_stops = 0
+    for city in cities_list:
+        total_cities += 1
+        total_days += city.get("days_suggested", 0)
+        total_stops += len(city.get("stops") or ())
+    return total_cities, total_days, total_stops
+
+
+def _user_content(text: str) -> types.Content:
+    """Wrap a prompt as a user message for Runner.run_async()."""
+    return types.Content(role="user", parts=[types.Part(text=text)])
+
+
+def _selected_regions_json(workflow_data: dict, selected_regions: List[dict]) -> str:
+    """JSON for the selected regions, serialized once per selection.
+
+    Cached on workflow_data (one discovery run), where region_id is unique;
+    ids are not unique across books, so the cache must not outlive the run.
+    """
+    cache = workflow_data.setdefault("selected_regions_json", {})
+    key = tuple(r.get("region_id") for r in selected_regions)
+    if key not in cache:
+        cache[key] = json.dumps(selected_regions)
+    return cache[key]
+
+
+@st.cache_resource
+def _get_session_service():
+    """Session service shared by every phase and rerun of this process.
+
+    Phase 3 continues the session created in Phases 1-2, so both phases
+    must talk to the same (in-memory) service instance.
+    """
+    config = _get_config()
+    return create_session_service(
+        connection_string=config.database_url, use_database=False  # Use in-memory for demo
+    )
+
+
+def _run_async(coro):
+    """Run a coroutine to completion on a new event loop (uvloop if installed)."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+@st.cache_resource
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop running in a daemon thread, for speculative background work."""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="storyland-prefetch", daemon=True).start()
+    return loop
+
+
+class _SilentPlaceholder:
+    """Stands in for progress/status placeholders during background runs."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def _prefetch_key(region: dict, preferences: dict) -> tuple:
+    """Identify a prefetched itinerary by its region and preferences."""
+    return (region.get("region_id"), tuple(sorted(preferences.items())))
+
+
+def _cancel_prefetch() -> None:
+    """Cancel any in-flight prefetch for this browser session."""
+    prefetch = st.session_state.get("prefetch")
+    if prefetch:
+        prefetch[1].cancel()
+    st.session_state.prefetch = None
+
+
+def _schedule_prefetch(region: dict, workflow_data: dict, preferences: dict) -> None:
+    """Start composing the itinerary for region in the background.
+
+    Runs in a copy of the discovery session (same state and history) so the
+    speculative composition never adds events to the session the user may
+    still compose other regions in.
+    """
+    key = _prefetch_key(region, preferences)
+    prefetch = st.session_state.get("prefetch")
+    if prefetch and prefetch[0] == key:
+        return
+
+    _cancel_prefetch()
+    silent = _SilentPlaceholder()
+    future = asyncio.run_coroutine_threadsafe(
+        create_itinerary_for_regions(
+            [region], workflow_data, preferences, silent, silent, fork_session=True
+        ),
+        _get_background_loop(),
+    )
+    st.session_state.prefetch = (key, future)
+
+
+def _take_prefetched(selected_regions: List[dict], preferences: dict) -> Optional[dict]:
+    """Return the prefetched itinerary if it matches this request, else None.
+
+    Waits for a matching prefetch that is still running (it has a head start
+    on a new run), up to the workflow timeout; a non-matching or timed-out one
+    is cancelled.
+    """
+    prefetch = st.session_state.get("prefetch")
+    st.session_state.prefetch = None
+    if not prefetch:
+        return None
+
+    key, future = prefetch
+    if len(selected_regions) != 1 or key != _prefetch_key(selected_regions[0], preferences):
+        future.cancel()
+        return None
+    try:
+        return future.result(timeout=_get_config().workflow_timeout)
+    except Exception:
+        future.cancel()
+        return None
+
 
 def setup_page():
     """Configure Streamlit page settings."""
@@ -43,6 +281,21 @@ def setup_page():
     st.markdown("---")
 
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _fetch_cover(image_url: str) -> Optional[bytes]:
+    """Download a book cover once; reruns reuse the cached bytes.
+
+    Failures return None, which is cached too, so a dead or slow URL is only
+    tried once per TTL; callers then let the browser load the URL itself.
+    """
+    try:
+        response = requests.get(image_url, timeout=5)
+        response.raise_for_status()
+    except requests.RequestException:
+        return None
+    return response.content
+
+
 def display_book_info(book_metadata: dict, compact: bool = False) -> None:
     """Display book information with cover image.
 
@@ -63,7 +316,7 @@ def display_book_info(book_metadata: dict, compact: bool = False) -> None:
         with cols[0]:
             if image_url:
                 try:
-                    st.image(image_url, width=100)
+                    st.image(_fetch_cover(image_url) or image_url, width=100)
                 except Exception as e:
                     st.caption("📖 No image")
             else:
@@ -80,7 +333,7 @@ def display_book_info(book_metadata: dict, compact: bool = False) -> None:
         with col1:
             if image_url:
                 try:
-                    st.image(image_url, use_container_width=True)
+                    st.image(_fetch_cover(image_url) or image_url, use_container_width=True)
                 except Exception as e:
                     st.warning(f"📖 Cover image unavailable")
                     # Debug info (can be removed in production)
@@ -102,7 +355,7 @@ def display_book_info(book_metadata: dict, compact: bool = False) -> None:
                 st.markdown(description)
 
 
-def display_execution_trace(trace_events: list) -> None:
+def display_execution_trace(trace_events: List[TraceEvent]) -> None:
     """Display execution trace of agent activity."""
     if not trace_events:
         return
@@ -110,20 +363,22 @@ def display_execution_trace(trace_events: list) -> None:
     with st.expander(f"🔍 Execution Trace ({len(trace_events)} events)", expanded=False):
         st.markdown("**Agent Execution Timeline:**")
 
-        # Group by phase
-        phase1_events = [e for e in trace_events if e.get("phase") == "Phase 1"]
-        phase2_events = [e for e in trace_events if e.get("phase") == "Phase 2"]
+        # Group agent names by phase in a single pass
+        phase1_agents, phase2_agents = [], []
+        for event in trace_events:
+            if event.phase == "Phase 1":
+                phase1_agents.append(event.agent)
+            elif event.phase == "Phase 2":
+                phase2_agents.append(event.agent)
 
-        if phase1_events:
+        if phase1_agents:
             st.markdown("**Phase 1: Metadata Extraction**")
-            for event in phase1_events:
-                agent_name = event.get("agent", "unknown")
+            for agent_name in phase1_agents:
                 st.code(f"→ {agent_name}", language=None)
 
-        if phase2_events:
+        if phase2_agents:
             st.markdown("**Phase 2: Location Discovery**")
-            for event in phase2_events:
-                agent_name = event.get("agent", "unknown")
+            for agent_name in phase2_agents:
                 st.code(f"→ {agent_name}", language=None)
 
         st.caption(f"Total execution events: {len(trace_events)}")
@@ -218,22 +473,13 @@ def display_itinerary_card(city_plan: dict, city_number: int) -> None:
                 reason = stop.get("reason", "")
                 notes = stop.get("notes", "")
 
-                # Icon mapping for stop types
-                icons = {
-                    "landmark": "🏛️",
-                    "museum": "🏛️",
-                    "author_site": "✍️",
-                    "restaurant": "🍽️",
-                    "cafe": "☕",
-                    "bookstore": "📚",
-                    "other": "📍"
-                }
-                icon = icons.get(stop_type, "📍")
+                icon = _STOP_ICONS.get(stop_type, "📍")
+                label = _STOP_LABELS.get(stop_type) or stop_type.replace("_", " ").title()
 
                 # Use native Streamlit container instead of HTML for dark mode support
                 with st.container():
                     st.markdown(f"**{i}. {icon} {stop_name}**")
-                    st.caption(f"{stop_type.replace('_', ' ').title()} • {time_of_day}")
+                    st.caption(f"{label} • {time_of_day}")
                     if reason:
                         st.markdown(f"**Why:** {reason}")
                     if notes:
@@ -247,45 +493,59 @@ async def run_workflow(
     preferences: dict,
     progress_placeholder,
     status_placeholder,
-    trace_placeholder=None
+    trace_placeholder=None,
+    user_id: str = USER_ID,
 ) -> Optional[dict]:
     """
     Run the three-phase workflow and return the itinerary data.
 
     Args:
         trace_placeholder: Optional placeholder for displaying execution traces
+        user_id: Session owner; the demo passes one id per browser session
 
     Returns:
         Dictionary with keys: 'itinerary', 'region_analysis', 'book_metadata'
     """
     trace_events = []  # Collect trace events for display
-    config = load_config()
-
-    # Configure logging
-    configure_logging(level="INFO", enable_adk_debug=False)
-    logger = get_logger("storyland.streamlit")
-
-    # Configure model
-    retry_config = types.HttpRetryOptions(
-        attempts=5, exp_base=7, initial_delay=1, http_status_codes=[429, 500, 503, 504]
-    )
-    model = Gemini(
-        model=config.model_name, api_key=config.google_api_key, retry_options=retry_config
-    )
-
-    # Create services
-    session_service = create_session_service(
-        connection_string=config.database_url, use_database=False  # Use in-memory for demo
-    )
+    trace_lines = ["**🔍 Live Execution Trace:**", ""]
+    pending_lines = 0
+    last_flush = time.monotonic()
+
+    def flush_trace():
+        nonlocal pending_lines, last_flush
+        if trace_placeholder and pending_lines:
+            trace_placeholder.code("\n".join(trace_lines), language=None)
+        pending_lines = 0
+        last_flush = time.monotonic()
+
+    def record_trace(phase: str, event) -> None:
+        """Collect a trace event and update the live trace display."""
+        nonlocal pending_lines
+        trace_events.append(TraceEvent(
+            phase,
+            event.author,
+            str(event.create_time) if hasattr(event, 'create_time') else "N/A",
+        ))
+        # Append one line instead of rebuilding the whole text per event
+        trace_lines.append(f"➤ [{phase}] {event.author}")
+        pending_lines += 1
+        if (
+            pending_lines >= TRACE_FLUSH_EVERY
+            or time.monotonic() - last_flush > TRACE_FLUSH_INTERVAL
+        ):
+            flush_trace()
+
+    logger = _get_logger()
+    model = _create_model(_get_config())
+    session_service = _get_session_service()
 
     # Build initial state
     initial_state = {"book_title": book_title, "author": author or ""}
     if preferences:
         initial_state["user:preferences"] = preferences
 
-    # Create session
+    # Create session (continued by Phase 3, see create_itinerary_for_regions)
     session_id = str(uuid.uuid4())
-    user_id = "streamlit_demo"
 
     await session_service.create_session(
         app_name="storyland",
@@ -294,7 +554,10 @@ async def run_workflow(
         state=initial_state,
     )
 
-    workflow_data = {}
+    workflow_data = {"session_id": session_id, "user_id": user_id}
+    # State written by the agents (e.g. via output_key), merged from each
+    # event's state_delta so results are read without a get_session() call
+    accumulated_state = {}
 
     try:
         # Phase 1: Extract book metadata
@@ -310,32 +573,21 @@ async def run_workflow(
         )
 
         metadata_prompt = f"""Find book metadata for "{book_title}" by {author or 'unknown author'}."""
-        metadata_message = types.Content(role="user", parts=[types.Part(text=metadata_prompt)])
+        metadata_message = _user_content(metadata_prompt)
 
         async with metadata_runner:
             async for event in metadata_runner.run_async(
                 user_id=user_id, session_id=session_id, new_message=metadata_message
             ):
+                if event.actions and event.actions.state_delta:
+                    accumulated_state.update(event.actions.state_delta)
                 # Collect trace events
                 if event.author:
-                    trace_events.append({
-                        "phase": "Phase 1",
-                        "agent": event.author,
-                        "type": "agent_event",
-                        "timestamp": str(event.create_time) if hasattr(event, 'create_time') else "N/A"
-                    })
-                    # Update trace display in real-time
-                    if trace_placeholder:
-                        trace_text = "**🔍 Live Execution Trace:**\n\n"
-                        for t in trace_events:
-                            trace_text += f"➤ [{t['phase']}] {t['agent']}\n"
-                        trace_placeholder.code(trace_text, language=None)
-
-        # Get metadata from session state
-        session = await session_service.get_session(
-            app_name="storyland", user_id=user_id, session_id=session_id
-        )
-        book_metadata = session.state.get("book_metadata", {})
+                    record_trace("Phase 1", event)
+        flush_trace()
+
+        # Get metadata from the state written during Phase 1
+        book_metadata = accumulated_state.get("book_metadata", {})
         exact_title = book_metadata.get("book_title", book_title)
         exact_author = book_metadata.get("author", author or "Unknown")
         published_date = book_metadata.get("published_date", "")
@@ -372,28 +624,17 @@ async def run_workflow(
         discovery_prompt = f"""Discover travel locations for "{exact_title}" by {exact_author}.
 
 Find cities, landmarks, and author-related sites, then group them into practical travel regions."""
-        discovery_message = types.Content(
-            role="user", parts=[types.Part(text=discovery_prompt)]
-        )
+        discovery_message = _user_content(discovery_prompt)
 
         async with discovery_runner:
             async for event in discovery_runner.run_async(
                 user_id=user_id, session_id=session_id, new_message=discovery_message
             ):
+                if event.actions and event.actions.state_delta:
+                    accumulated_state.update(event.actions.state_delta)
                 # Collect trace events
                 if event.author:
-                    trace_events.append({
-                        "phase": "Phase 2",
-                        "agent": event.author,
-                        "type": "agent_event",
-                        "timestamp": str(event.create_time) if hasattr(event, 'create_time') else "N/A"
-                    })
-                    # Update trace display in real-time
-                    if trace_placeholder:
-                        trace_text = "**🔍 Live Execution Trace:**\n\n"
-                        for t in trace_events:
-                            trace_text += f"➤ [{t['phase']}] {t['agent']}\n"
-                        trace_placeholder.code(trace_text, language=None)
+                    record_trace("Phase 2", event)
 
                 # Update status with more detail
                 if event.author == "city_pipeline":
@@ -408,18 +649,16 @@ Find cities, landmarks, and author-related sites, then group them into practical
                 elif event.author == "region_analyzer":
                     progress_placeholder.progress(0.7)
                     status_placeholder.info("🌍 **Phase 2:** Analyzing geographic regions...")
+        flush_trace()
 
-        # Get region analysis and discoveries from session state
-        session = await session_service.get_session(
-            app_name="storyland", user_id=user_id, session_id=session_id
-        )
-        region_analysis = session.state.get("region_analysis", {})
+        # Get region analysis and discoveries from the state written in Phase 2
+        region_analysis = accumulated_state.get("region_analysis", {})
         workflow_data["region_analysis"] = region_analysis
 
         # Also get discovery data for preview
-        workflow_data["city_discovery"] = session.state.get("city_discovery", {})
-        workflow_data["landmark_discovery"] = session.state.get("landmark_discovery", {})
-        workflow_data["author_sites"] = session.state.get("author_sites", {})
+        workflow_data["city_discovery"] = accumulated_state.get("city_discovery", {})
+        workflow_data["landmark_discovery"] = accumulated_state.get("landmark_discovery", {})
+        workflow_data["author_sites"] = accumulated_state.get("author_sites", {})
 
         # Calculate totals for success message
         num_cities = len(workflow_data["city_discovery"].get("cities", []))
@@ -442,56 +681,116 @@ Find cities, landmarks, and author-related sites, then group them into practical
     except Exception as e:
         logger.error("workflow_error", error=str(e))
         status_placeholder.error(f"❌ Error: {str(e)}")
+        await session_service.delete_session(
+            app_name="storyland", user_id=user_id, session_id=session_id
+        )
         return None
 
 
+async def _end_discovery_session(workflow_data: dict) -> None:
+    """Delete the Phase 1-2 session once no more itineraries will use it."""
+    await _get_session_service().delete_session(
+        app_name="storyland",
+        user_id=workflow_data["user_id"],
+        session_id=workflow_data["session_id"],
+    )
+
+
+async def _fork_session(session_service, session):
+    """Copy session's state and event history into a new session.
+
+    App- and user-scoped keys are shared by every session of the user, so
+    only session-scoped state is copied. Events are deep-copied (appending
+    trims them in place, and the original session may be read concurrently)
+    and lose their state deltas, which the copied state already reflects.
+    """
+    state = {
+        key: value for key, value in session.state.items()
+        if not key.startswith(("app:", "user:", "temp:"))
+    }
+    fork = await session_service.create_session(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=str(uuid.uuid4()),
+        state=state,
+    )
+    for event in session.events:
+        event = event.model_copy(deep=True)
+        event.actions.state_delta = {}
+        await session_service.append_event(fork, event)
+    return fork
+
+
 async def create_itinerary_for_regions(
     selected_regions: List[dict],
-    book_metadata: dict,
+    workflow_data: dict,
     preferences: dict,
     progress_placeholder,
-    status_placeholder
+    status_placeholder,
+    fork_session: bool = False,
 ) -> Optional[dict]:
-    """Create itinerary for selected regions."""
-    config = load_config()
-    configure_logging(level="INFO", enable_adk_debug=False)
-    logger = get_logger("storyland.streamlit")
-
-    # Configure model
-    retry_config = types.HttpRetryOptions(
-        attempts=5, exp_base=7, initial_delay=1, http_status_codes=[429, 500, 503, 504]
-    )
-    model = Gemini(
-        model=config.model_name, api_key=config.google_api_key, retry_options=retry_config
-    )
-
-    # Create services
-    session_service = create_session_service(
-        connection_string=config.database_url, use_database=False
-    )
-
-    # Create session with selected regions
-    session_id = str(uuid.uuid4())
-    user_id = "streamlit_demo"
+    """Create itinerary for selected regions.
+
+    Continues the Phase 1-2 session recorded in workflow_data, so the
+    composition agents see the discovery state and conversation; a fresh
+    session is only created if that one is no longer available. With
+    fork_session, composition runs in a copy of that session instead, leaving
+    the original untouched; the copy is deleted when composition finishes or
+    is cancelled.
+    """
+    logger = _get_logger()
+    model = _create_model(_get_config())
+    session_service = _get_session_service()
 
+    book_metadata = workflow_data.get("book_metadata", {})
     exact_title = book_metadata.get("book_title", "")
     exact_author = book_metadata.get("author", "")
 
-    initial_state = {
-        "book_title": exact_title,
-        "author": exact_author,
-        "book_metadata": book_metadata,
-        "selected_regions": selected_regions,
-    }
+    # Phase 3 inputs; preferences may have changed in the sidebar since Phase 1
+    state_delta = {"selected_regions": selected_regions}
     if preferences:
-        initial_state["user:preferences"] = preferences
+        state_delta["user:preferences"] = preferences
+
+    user_id = workflow_data.get("user_id", USER_ID)
+    session_id = workflow_data.get("session_id")
+    session = None
+    # Fork or fallback session created here rather than in Phases 1-2;
+    # deleted when composition ends
+    owned_session_id = None
+    if session_id:
+        session = await session_service.get_session(
+            app_name="storyland", user_id=user_id, session_id=session_id
+        )
 
-    await session_service.create_session(
-        app_name="storyland",
-        user_id=user_id,
-        session_id=session_id,
-        state=initial_state,
-    )
+    if session and fork_session:
+        session = await _fork_session(session_service, session)
+        session_id = owned_session_id = session.id
+
+    if session:
+        # Record the new state through an event: get_session() returns a copy,
+        # so mutating session.state directly would not persist.
+        await session_service.append_event(
+            session,
+            Event(
+                author="user",
+                invocation_id=str(uuid.uuid4()),
+                actions=EventActions(state_delta=state_delta),
+            ),
+        )
+    else:
+        # Phase 1-2 session is gone (e.g. the server restarted): start a new one
+        session_id = owned_session_id = str(uuid.uuid4())
+        await session_service.create_session(
+            app_name="storyland",
+            user_id=user_id,
+            session_id=session_id,
+            state={
+                "book_title": exact_title,
+                "author": exact_author,
+                "book_metadata": book_metadata,
+                **state_delta,
+            },
+        )
 
     try:
         # Phase 3: Composition
@@ -510,13 +809,11 @@ async def create_itinerary_for_regions(
 
         composition_prompt = f"""Create a travel itinerary for "{exact_title}" by {exact_author}.
 
-Use ONLY the cities from the selected region(s): {json.dumps(selected_regions)}
+Use ONLY the cities from the selected region(s): {_selected_regions_json(workflow_data, selected_regions)}
 
 Create a personalized itinerary based on user preferences and the selected region(s).
 Include ALL cities from the selected regions in your itinerary."""
-        composition_message = types.Content(
-            role="user", parts=[types.Part(text=composition_prompt)]
-        )
+        composition_message = _user_content(composition_prompt)
 
         final_response = None
         async with composition_runner:
@@ -535,22 +832,18 @@ Include ALL cities from the selected regions in your itinerary."""
         if final_response and final_response.content and final_response.content.parts:
             for part in final_response.content.parts:
                 if hasattr(part, "text") and part.text:
-                    json_start = part.text.find("{")
-                    json_end = part.text.rfind("}") + 1
-
-                    if json_start >= 0 and json_end > json_start:
-                        try:
-                            result_data = json.loads(part.text[json_start:json_end])
-                            break
-                        except json.JSONDecodeError as e:
-                            logger.error("json_parse_error", error=str(e))
+                    try:
+                        result_data = _parse_json_object(part.text)
+                    except json.JSONDecodeError as e:
+                        logger.error("json_parse_error", error=str(e))
+                    if result_data:
+                        break
 
         progress_placeholder.progress(1.0)
 
         # Show success message with details
         if result_data:
-            num_cities = len(result_data.get("cities", []))
-            total_stops = sum(len(city.get("stops", [])) for city in result_data.get("cities", []))
+            num_cities, _, total_stops = _itinerary_totals(result_data.get("cities", []))
             status_placeholder.success(
                 f"✅ **Itinerary Complete!** Created personalized plan with {num_cities} cities and {total_stops} stops"
             )
@@ -564,6 +857,12 @@ Include ALL cities from the selected regions in your itinerary."""
         status_placeholder.error(f"❌ Error: {str(e)}")
         return None
 
+    finally:
+        if owned_session_id:
+            await session_service.delete_session(
+                app_name="storyland", user_id=user_id, session_id=owned_session_id
+            )
+
 
 def main():
     """Main Streamlit app."""
@@ -574,8 +873,12 @@ def main():
         st.session_state.workflow_data = None
     if 'itinerary_data' not in st.session_state:
         st.session_state.itinerary_data = None
+    if 'itinerary_totals' not in st.session_state:
+        st.session_state.itinerary_totals = None  # Summary of itinerary_data
     if 'current_step' not in st.session_state:
         st.session_state.current_step = 'input'  # input, region_selection, itinerary
+    if 'user_id' not in st.session_state:
+        st.session_state.user_id = f"{USER_ID}-{uuid.uuid4()}"  # One per browser session
 
     # Sidebar for inputs
     with st.sidebar:
@@ -610,6 +913,12 @@ def main():
 
         prefers_museums = st.checkbox("Prefer Museums", value=True)
         travels_with_kids = st.checkbox("Traveling with Kids", value=False)
+        prefetch_enabled = st.checkbox(
+            "⚡ Prefetch default region",
+            value=False,
+            help="Start composing the first region's itinerary while you choose. "
+                 "Uses an extra LLM call if you pick different regions.",
+        )
 
         st.markdown("---")
         start_button = st.button("🚀 Create Itinerary", type="primary", use_container_width=True)
@@ -617,8 +926,12 @@ def main():
         # Reset button
         if st.session_state.current_step != 'input':
             if st.button("🔄 Start Over", use_container_width=True):
+                _cancel_prefetch()
+                if st.session_state.workflow_data:
+                    _run_async(_end_discovery_session(st.session_state.workflow_data))
                 st.session_state.workflow_data = None
                 st.session_state.itinerary_data = None
+                st.session_state.itinerary_totals = None
                 st.session_state.current_step = 'input'
                 st.rerun()
 
@@ -643,8 +956,11 @@ def main():
 
         # Run Phase 1 & 2 (metadata + discovery)
         try:
-            workflow_data = asyncio.run(
-                run_workflow(book_title, author, preferences, progress_placeholder, status_placeholder, trace_placeholder)
+            workflow_data = _run_async(
+                run_workflow(
+                    book_title, author, preferences, progress_placeholder, status_placeholder,
+                    trace_placeholder, user_id=st.session_state.user_id,
+                )
             )
 
             if workflow_data:
@@ -701,14 +1017,15 @@ def main():
 
         # Region selection
         st.markdown("---")
+        region_names = {
+            r.get("region_id"): r.get("region_name", f"Region {r.get('region_id')}")
+            for r in regions
+        }
         selected_region_ids = st.multiselect(
             "Select one or more regions to explore:",
-            options=[r.get("region_id") for r in regions],
+            options=list(region_names),
             default=[regions[0].get("region_id")] if regions else [],
-            format_func=lambda rid: next(
-                (r.get("region_name", f"Region {rid}") for r in regions if r.get("region_id") == rid),
-                f"Region {rid}"
-            )
+            format_func=lambda rid: region_names.get(rid, f"Region {rid}")
         )
 
         if not selected_region_ids:
@@ -716,7 +1033,14 @@ def main():
             return
 
         # Get selected region objects
-        selected_regions = [r for r in regions if r.get("region_id") in selected_region_ids]
+        selected_ids = set(selected_region_ids)
+        selected_regions = [r for r in regions if r.get("region_id") in selected_ids]
+
+        # Speculatively compose the default region while the user decides
+        if prefetch_enabled:
+            _schedule_prefetch(regions[0], workflow_data, preferences)
+        else:
+            _cancel_prefetch()
 
         # Button to create itinerary
         if st.button("✈️ Create Detailed Itinerary", type="primary"):
@@ -724,20 +1048,25 @@ def main():
             progress_placeholder = st.progress(0)
             status_placeholder = st.empty()
 
-            # Run Phase 3 (composition)
+            # Run Phase 3 (composition), unless the prefetch already covers it
             try:
-                itinerary_data = asyncio.run(
-                    create_itinerary_for_regions(
-                        selected_regions,
-                        workflow_data.get("book_metadata", {}),
-                        preferences,
-                        progress_placeholder,
-                        status_placeholder
+                with st.spinner("Composing itinerary..."):
+                    itinerary_data = _take_prefetched(selected_regions, preferences)
+                if not itinerary_data:
+                    itinerary_data = _run_async(
+                        create_itinerary_for_regions(
+                            selected_regions,
+                            workflow_data,
+                            preferences,
+                            progress_placeholder,
+                            status_placeholder
+                        )
                     )
-                )
 
                 if itinerary_data:
+                    _run_async(_end_discovery_session(workflow_data))
                     st.session_state.itinerary_data = itinerary_data
+                    st.session_state.itinerary_totals = None
                     st.session_state.current_step = 'itinerary'
                     st.rerun()
                 else:
@@ -767,15 +1096,17 @@ def main():
             st.error("❌ No cities found in itinerary")
             return
 
-        # Summary statistics
+        # Summary statistics (computed once per itinerary, reused on reruns)
+        if st.session_state.itinerary_totals is None:
+            st.session_state.itinerary_totals = _itinerary_totals(cities_list)
+        total_cities, total_days, total_stops = st.session_state.itinerary_totals
+
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total Cities", len(cities_list))
+            st.metric("Total Cities", total_cities)
         with col2:
-            total_days = sum(city.get("days_suggested", 0) for city in cities_list)
             st.metric("Total Days", total_days)
         with col3:
-            total_stops = sum(len(city.get("stops", [])) for city in cities_list)
             st.metric("Total Stops", total_stops)
 
         st.markdown("---")
@@ -792,30 +1123,7 @@ def main():
 
     # Welcome screen (default)
     if st.session_state.current_step == 'input' and not start_button:
-        st.markdown("""
-        ### Welcome to StoryLand AI!
-
-        Transform your favorite books into real travel experiences. Here's how it works:
-
-        1. **📚 Enter a book title** - Tell us which book you'd like to explore
-        2. **⚙️ Set your preferences** - Budget, pace, and travel style
-        3. **🌍 Choose regions** - Select which geographic areas you want to visit
-        4. **🗺️ Get your itinerary** - Receive a detailed, personalized travel plan
-
-        ### Features:
-        - **AI-powered research** - Discovers locations tied to book settings, author sites, and themes
-        - **Geographic grouping** - Regions organized for practical travel planning
-        - **Personalized itineraries** - Tailored to your budget and travel preferences
-        - **Detailed stops** - Each location includes context, timing, and tips
-
-        **Ready to start?** Enter a book title in the sidebar and click "Create Itinerary"!
-
-        ### Example Books:
-        - Pride and Prejudice by Jane Austen
-        - The Great Gatsby by F. Scott Fitzgerald
-        - 1984 by George Orwell
-        - The Nightingale by Kristin Hannah
-        """)
+        st.markdown(_WELCOME_MD)
 
 
 if __name__ == "__main__":
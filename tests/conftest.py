@@ -6,24 +6,124 @@ This module provides:
 - Sample book data fixtures
 - Session state fixtures
 - Preference fixtures
+
+Sample data and mock response fixtures are session-scoped: they are built
+once per run and shared by every test, so tests must treat them as
+read-only. A test that needs a variant should build one locally, e.g.
+sample_city_plan.model_copy(update={...}) or {**sample_preferences_dict, ...},
+rather than assigning to the shared object. The mock tool contexts are
+session-scoped too: tools under test only read their state.
 """
 
+import asyncio
 import json
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from dataclasses import dataclass, field
+from unittest.mock import patch, AsyncMock
 from typing import Dict, Any
 
 from models.book import BookMetadata, BookContext, BookInfo
-from models.discovery import CityDiscovery, LandmarkDiscovery, AuthorSites, CityInfo, LandmarkInfo, AuthorSiteInfo
+from models.discovery import (
+    CityDiscovery, LandmarkDiscovery, AuthorSites, CityInfo, LandmarkInfo, AuthorSiteInfo,
+    RegionCity, RegionOption, RegionAnalysis,
+)
 from models.itinerary import TripItinerary, CityPlan, CityStop
 from models.preferences import TravelPreferences
 
 
+# =============================================================================
+# Shared Sample Data (built once at import; fixtures hand out these objects)
+# =============================================================================
+
+_SAMPLE_BOOK_INFOS = (
+    BookInfo(
+        title="Pride and Prejudice",
+        authors=["Jane Austen"],
+        description="A classic novel about love and social standing.",
+        published_date="1813",
+        categories=["Fiction", "Romance"],
+        image_url="https://books.google.com/books/content?id=s1gVAAAAYAAJ"
+    ),
+    BookInfo(
+        title="Pride and Prejudice and Zombies",
+        authors=["Seth Grahame-Smith"],
+        description="A parody mashup.",
+        published_date="2009",
+        categories=["Fiction", "Horror"],
+        image_url=None
+    ),
+)
+
+_GOOGLE_BOOKS_RESPONSE = {
+    "kind": "books#volumes",
+    "totalItems": 1,
+    "items": [
+        {
+            "id": "s1gVAAAAYAAJ",
+            "volumeInfo": {
+                "title": "Pride and Prejudice",
+                "authors": ["Jane Austen"],
+                "description": "A classic novel about love and social standing in early 19th century England.",
+                "publishedDate": "1813",
+                "categories": ["Fiction", "Romance"],
+                "imageLinks": {
+                    "thumbnail": "https://books.google.com/books/content?id=s1gVAAAAYAAJ"
+                }
+            }
+        }
+    ]
+}
+
+_GOOGLE_BOOKS_EMPTY = {
+    "kind": "books#volumes",
+    "totalItems": 0
+}
+
+
+_SAMPLE_PREFS = TravelPreferences(
+    prefers_museums=True,
+    travels_with_kids=False,
+    budget="moderate",
+    favorite_genres=["Classic Literature", "Romance"],
+    favorite_authors=["Jane Austen", "Charlotte Bronte"],
+    dietary_restrictions=[],
+    accessibility_needs=False,
+    preferred_pace="relaxed"
+)
+
+_SAMPLE_PREFS_DICT = {
+    "prefers_museums": True,
+    "travels_with_kids": False,
+    "budget": "moderate",
+    "favorite_genres": ["Classic Literature", "Romance"],
+    "favorite_authors": ["Jane Austen"],
+    "dietary_restrictions": [],
+    "accessibility_needs": False,
+    "preferred_pace": "relaxed"
+}
+
+# Traveler profiles are variations on the base preferences
+_LUXURY_PREFS_DICT = {
+    **_SAMPLE_PREFS_DICT,
+    "budget": "luxury",
+    "favorite_genres": ["Literary Fiction"],
+    "favorite_authors": [],
+    "dietary_restrictions": ["vegetarian"],
+}
+
+_FAMILY_PREFS_DICT = {
+    **_SAMPLE_PREFS_DICT,
+    "travels_with_kids": True,
+    "favorite_genres": ["Adventure", "Fantasy"],
+    "favorite_authors": [],
+}
+
+
 # =============================================================================
 # Sample Book Data Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_book_metadata() -> BookMetadata:
     """Sample BookMetadata for Pride and Prejudice."""
     return BookMetadata(
@@ -36,7 +136,7 @@ def sample_book_metadata() -> BookMetadata:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_book_context() -> BookContext:
     """Sample BookContext for Pride and Prejudice."""
     return BookContext(
@@ -46,40 +146,23 @@ def sample_book_context() -> BookContext:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_book_info() -> BookInfo:
     """Sample BookInfo from Google Books API."""
-    return BookInfo(
-        title="Pride and Prejudice",
-        authors=["Jane Austen"],
-        description="A classic novel about love and social standing.",
-        published_date="1813",
-        categories=["Fiction", "Romance"],
-        image_url="https://books.google.com/books/content?id=s1gVAAAAYAAJ"
-    )
+    return _SAMPLE_BOOK_INFOS[0]
 
 
-@pytest.fixture
-def sample_book_info_list(sample_book_info) -> list:
-    """List of sample BookInfo objects."""
-    return [
-        sample_book_info,
-        BookInfo(
-            title="Pride and Prejudice and Zombies",
-            authors=["Seth Grahame-Smith"],
-            description="A parody mashup.",
-            published_date="2009",
-            categories=["Fiction", "Horror"],
-            image_url=None
-        )
-    ]
+@pytest.fixture(scope="session")
+def sample_book_info_list() -> tuple:
+    """Sample BookInfo search results (best match first)."""
+    return _SAMPLE_BOOK_INFOS
 
 
 # =============================================================================
 # Discovery Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_city_discovery() -> CityDiscovery:
     """Sample CityDiscovery results."""
     return CityDiscovery(
@@ -98,7 +181,7 @@ def sample_city_discovery() -> CityDiscovery:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_landmark_discovery() -> LandmarkDiscovery:
     """Sample LandmarkDiscovery results."""
     return LandmarkDiscovery(
@@ -117,7 +200,7 @@ def sample_landmark_discovery() -> LandmarkDiscovery:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_author_sites() -> AuthorSites:
     """Sample AuthorSites results."""
     return AuthorSites(
@@ -136,11 +219,42 @@ def sample_author_sites() -> AuthorSites:
     )
 
 
+@pytest.fixture(scope="session")
+def sample_region_option() -> RegionOption:
+    """Sample RegionOption with a single city."""
+    return RegionOption(
+        region_id=1,
+        region_name="Test Region",
+        cities=[RegionCity(name="City", country="Country")],
+        estimated_days=3,
+        travel_note="Note",
+        highlights="Highlights",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_region_analysis() -> RegionAnalysis:
+    """Sample RegionAnalysis with one region."""
+    return RegionAnalysis(
+        regions=[
+            RegionOption(
+                region_id=1,
+                region_name="Test",
+                cities=[],
+                estimated_days=1,
+                travel_note="Note",
+                highlights="Highlights",
+            )
+        ],
+        analysis_note="Test analysis",
+    )
+
+
 # =============================================================================
 # Itinerary Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_city_stop() -> CityStop:
     """Sample CityStop."""
     return CityStop(
@@ -152,7 +266,7 @@ def sample_city_stop() -> CityStop:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_city_plan(sample_city_stop) -> CityPlan:
     """Sample CityPlan."""
     return CityPlan(
@@ -164,7 +278,7 @@ def sample_city_plan(sample_city_stop) -> CityPlan:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_trip_itinerary(sample_city_plan) -> TripItinerary:
     """Sample TripItinerary."""
     return TripItinerary(
@@ -177,142 +291,104 @@ def sample_trip_itinerary(sample_city_plan) -> TripItinerary:
 # Preferences Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_preferences() -> TravelPreferences:
     """Sample TravelPreferences."""
-    return TravelPreferences(
-        prefers_museums=True,
-        travels_with_kids=False,
-        budget="moderate",
-        favorite_genres=["Classic Literature", "Romance"],
-        favorite_authors=["Jane Austen", "Charlotte Bronte"],
-        dietary_restrictions=[],
-        accessibility_needs=False,
-        preferred_pace="relaxed"
-    )
+    return _SAMPLE_PREFS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_preferences_dict() -> Dict[str, Any]:
     """Sample preferences as dictionary (for session state)."""
-    return {
-        "prefers_museums": True,
-        "travels_with_kids": False,
-        "budget": "moderate",
-        "favorite_genres": ["Classic Literature", "Romance"],
-        "favorite_authors": ["Jane Austen"],
-        "dietary_restrictions": [],
-        "accessibility_needs": False,
-        "preferred_pace": "relaxed"
-    }
+    return _SAMPLE_PREFS_DICT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def luxury_preferences_dict() -> Dict[str, Any]:
     """Luxury traveler preferences."""
-    return {
-        "prefers_museums": True,
-        "travels_with_kids": False,
-        "budget": "luxury",
-        "favorite_genres": ["Literary Fiction"],
-        "favorite_authors": [],
-        "dietary_restrictions": ["vegetarian"],
-        "accessibility_needs": False,
-        "preferred_pace": "relaxed"
-    }
+    return _LUXURY_PREFS_DICT
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def family_preferences_dict() -> Dict[str, Any]:
     """Family traveler preferences."""
-    return {
-        "prefers_museums": True,
-        "travels_with_kids": True,
-        "budget": "moderate",
-        "favorite_genres": ["Adventure", "Fantasy"],
-        "favorite_authors": [],
-        "dietary_restrictions": [],
-        "accessibility_needs": False,
-        "preferred_pace": "relaxed"
-    }
+    return _FAMILY_PREFS_DICT
 
 
 # =============================================================================
 # Mock Responses
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_google_books_response() -> Dict[str, Any]:
     """Mock Google Books API response."""
-    return {
-        "kind": "books#volumes",
-        "totalItems": 1,
-        "items": [
-            {
-                "id": "s1gVAAAAYAAJ",
-                "volumeInfo": {
-                    "title": "Pride and Prejudice",
-                    "authors": ["Jane Austen"],
-                    "description": "A classic novel about love and social standing in early 19th century England.",
-                    "publishedDate": "1813",
-                    "categories": ["Fiction", "Romance"],
-                    "imageLinks": {
-                        "thumbnail": "https://books.google.com/books/content?id=s1gVAAAAYAAJ"
-                    }
-                }
-            }
-        ]
-    }
+    return _GOOGLE_BOOKS_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_google_books_empty_response() -> Dict[str, Any]:
     """Mock empty Google Books API response."""
-    return {
-        "kind": "books#volumes",
-        "totalItems": 0
-    }
+    return _GOOGLE_BOOKS_EMPTY
+
 
+@dataclass
+class _FakeToolContext:
+    """Stand-in for ADK's ToolContext; tools under test only read .state."""
+    state: Dict[str, Any] = field(default_factory=dict)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_tool_context(sample_preferences_dict):
     """Mock ToolContext for testing tools."""
-    context = MagicMock()
-    context.state = {"user:preferences": sample_preferences_dict}
-    return context
+    return _FakeToolContext(state={"user:preferences": sample_preferences_dict})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_tool_context_no_preferences():
     """Mock ToolContext with no preferences."""
-    context = MagicMock()
-    context.state = {}
-    return context
+    return _FakeToolContext()
 
 
 # =============================================================================
 # Session State Fixtures
 # =============================================================================
 
-@pytest.fixture
-def sample_session_state(
-    sample_book_metadata,
-    sample_book_context,
-    sample_city_discovery,
-    sample_landmark_discovery,
-    sample_author_sites,
-    sample_preferences_dict
-) -> Dict[str, Any]:
-    """Complete session state after running all agents."""
+@pytest.fixture(scope="session")
+def session_state_book_only(sample_book_metadata, sample_book_context) -> Dict[str, Any]:
+    """Session state after the metadata stage: book inputs and book agents only."""
     return {
         "book_title": "Pride and Prejudice",
         "author": "Jane Austen",
-        "user:preferences": sample_preferences_dict,
         "book_metadata": sample_book_metadata.model_dump(),
         "book_context": sample_book_context.model_dump(),
+    }
+
+
+@pytest.fixture(scope="session")
+def session_state_discoveries(
+    sample_city_discovery,
+    sample_landmark_discovery,
+    sample_author_sites,
+) -> Dict[str, Any]:
+    """Discovery agent outputs as session state stores them."""
+    return {
         "city_discovery": sample_city_discovery.model_dump(),
         "landmark_discovery": sample_landmark_discovery.model_dump(),
         "author_sites": sample_author_sites.model_dump(),
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_session_state(
+    session_state_book_only,
+    session_state_discoveries,
+    sample_preferences_dict,
+) -> Dict[str, Any]:
+    """Complete session state after running all agents (read-only)."""
+    return {
+        **session_state_book_only,
+        "user:preferences": sample_preferences_dict,
+        **session_state_discoveries,
         "reader_profile": "A relaxed traveler who enjoys museums and classic literature."
     }
 
@@ -321,8 +397,7 @@ def sample_session_state(
 # Async Test Helpers
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def event_loop_policy():
     """Use default event loop policy for async tests."""
-    import asyncio
     return asyncio.DefaultEventLoopPolicy()
@@ -25,17 +25,22 @@ from agents import (
 )
 
 
+MODEL_NAME = "gemini-2.0-flash"
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
+# Stateless inputs shared by every agent factory test in the session; tools
+# may be attached to many agents (unlike sub-agents, they have no parent).
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def model_name():
     """Return a valid model name string for agent creation."""
-    return "gemini-2.0-flash"
+    return MODEL_NAME
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_google_books_tool():
     """Create a mock Google Books FunctionTool."""
     def mock_search_book(title: str, author: str = "") -> str:
@@ -45,7 +50,7 @@ def mock_google_books_tool():
     return FunctionTool(mock_search_book)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_google_search_tool():
     """Create a mock Google Search FunctionTool."""
     def mock_search(query: str) -> str:
@@ -55,125 +60,87 @@ def mock_google_search_tool():
     return FunctionTool(mock_search)
 
 
-# =============================================================================
-# Book Metadata Pipeline Tests
-# =============================================================================
-
-class TestBookMetadataPipeline:
-    """Tests for create_book_metadata_pipeline."""
-
-    def test_creates_sequential_agent(self, model_name, mock_google_books_tool):
-        """Test that pipeline returns a SequentialAgent."""
-        pipeline = create_book_metadata_pipeline(model_name, mock_google_books_tool)
-
-        assert isinstance(pipeline, SequentialAgent)
+# Each fixture calls its own factory: an agent can have only one parent,
+# so built trees are shared between tests but never between fixtures.
 
-    def test_pipeline_has_correct_name(self, model_name, mock_google_books_tool):
-        """Test pipeline has expected name."""
-        pipeline = create_book_metadata_pipeline(model_name, mock_google_books_tool)
+@pytest.fixture(scope="session")
+def trip_composer_agent(model_name):
+    """Trip composer agent, built once per session."""
+    return create_trip_composer_agent(model_name)
 
-        assert pipeline.name == "book_metadata_pipeline"
 
-    def test_pipeline_has_sub_agents(self, model_name, mock_google_books_tool):
-        """Test pipeline contains sub-agents."""
-        pipeline = create_book_metadata_pipeline(model_name, mock_google_books_tool)
+@pytest.fixture(scope="session")
+def reader_profile_agent(model_name):
+    """Reader profile agent, built once per session."""
+    return create_reader_profile_agent(model_name)
 
-        assert len(pipeline.sub_agents) == 2
 
+@pytest.fixture(scope="session")
+def region_analyzer_agent(model_name):
+    """Region analyzer agent, built once per session."""
+    return create_region_analyzer_agent(model_name)
 
-# =============================================================================
-# Book Context Pipeline Tests
-# =============================================================================
 
-class TestBookContextPipeline:
-    """Tests for create_book_context_pipeline."""
+@pytest.fixture(scope="session")
+def metadata_stage(model_name, mock_google_books_tool):
+    """Metadata stage, built once per session."""
+    return create_metadata_stage(model_name, mock_google_books_tool)
 
-    def test_creates_sequential_agent(self, model_name, mock_google_search_tool):
-        """Test that pipeline returns a SequentialAgent."""
-        pipeline = create_book_context_pipeline(
-            model_name, mock_google_search_tool,
-            book_title="The Nightingale", author="Kristin Hannah"
-        )
 
-        assert isinstance(pipeline, SequentialAgent)
+@pytest.fixture(scope="session")
+def discovery_workflow(model_name):
+    """Discovery workflow, built once per session."""
+    return create_discovery_workflow(
+        model_name, book_title="1984", author="George Orwell"
+    )
 
-    def test_pipeline_has_correct_name(self, model_name, mock_google_search_tool):
-        """Test pipeline has expected name."""
-        pipeline = create_book_context_pipeline(
-            model_name, mock_google_search_tool,
-            book_title="The Nightingale", author="Kristin Hannah"
-        )
-
-        assert pipeline.name == "book_context_pipeline"
-
-    def test_pipeline_has_sub_agents(self, model_name, mock_google_search_tool):
-        """Test pipeline contains sub-agents."""
-        pipeline = create_book_context_pipeline(
-            model_name, mock_google_search_tool,
-            book_title="The Nightingale", author="Kristin Hannah"
-        )
-
-        assert len(pipeline.sub_agents) == 2
-
-
-# =============================================================================
-# City Pipeline Tests
-# =============================================================================
-
-class TestCityPipeline:
-    """Tests for create_city_pipeline."""
-
-    def test_creates_sequential_agent(self, model_name, mock_google_search_tool):
-        """Test that pipeline returns a SequentialAgent."""
-        pipeline = create_city_pipeline(model_name, mock_google_search_tool)
-
-        assert isinstance(pipeline, SequentialAgent)
-
-    def test_pipeline_has_correct_name(self, model_name, mock_google_search_tool):
-        """Test pipeline has expected name."""
-        pipeline = create_city_pipeline(model_name, mock_google_search_tool)
-
-        assert pipeline.name == "city_pipeline"
-
-
-# =============================================================================
-# Landmark Pipeline Tests
-# =============================================================================
 
-class TestLandmarkPipeline:
-    """Tests for create_landmark_pipeline."""
+@pytest.fixture(scope="session")
+def composition_workflow(model_name):
+    """Composition workflow, built once per session."""
+    return create_composition_workflow(model_name)
 
-    def test_creates_sequential_agent(self, model_name, mock_google_search_tool):
-        """Test that pipeline returns a SequentialAgent."""
-        pipeline = create_landmark_pipeline(model_name, mock_google_search_tool)
 
-        assert isinstance(pipeline, SequentialAgent)
+@pytest.fixture(scope="session")
+def eval_workflow(model_name, mock_google_books_tool):
+    """Eval workflow, built once per session."""
+    return create_eval_workflow(model_name, mock_google_books_tool)
 
-    def test_pipeline_has_correct_name(self, model_name, mock_google_search_tool):
-        """Test pipeline has expected name."""
-        pipeline = create_landmark_pipeline(model_name, mock_google_search_tool)
 
-        assert pipeline.name == "landmark_pipeline"
+def _index_sub_agents(agent):
+    """Map each direct sub-agent's name to the sub-agent."""
+    return {sub_agent.name: sub_agent for sub_agent in agent.sub_agents}
 
 
 # =============================================================================
-# Author Pipeline Tests
+# Pipeline Tests
 # =============================================================================
 
-class TestAuthorPipeline:
-    """Tests for create_author_pipeline."""
-
-    def test_creates_sequential_agent(self, model_name, mock_google_search_tool):
-        """Test that pipeline returns a SequentialAgent."""
-        pipeline = create_author_pipeline(model_name, mock_google_search_tool)
-
-        assert isinstance(pipeline, SequentialAgent)
-
-    def test_pipeline_has_correct_name(self, model_name, mock_google_search_tool):
-        """Test pipeline has expected name."""
-        pipeline = create_author_pipeline(model_name, mock_google_search_tool)
+PIPELINE_CASES = [
+    # (factory, tool fixture, extra kwargs, expected name, sub-agent count)
+    (create_book_metadata_pipeline, "mock_google_books_tool", {},
+     "book_metadata_pipeline", 2),
+    (create_book_context_pipeline, "mock_google_search_tool",
+     {"book_title": "The Nightingale", "author": "Kristin Hannah"},
+     "book_context_pipeline", 2),
+    (create_city_pipeline, "mock_google_search_tool", {}, "city_pipeline", 2),
+    (create_landmark_pipeline, "mock_google_search_tool", {}, "landmark_pipeline", 2),
+    (create_author_pipeline, "mock_google_search_tool", {}, "author_pipeline", 2),
+]
+
+
+@pytest.mark.parametrize(
+    "factory,tool_fixture,kwargs,name,n_subs",
+    PIPELINE_CASES,
+    ids=[case[3] for case in PIPELINE_CASES],
+)
+def test_pipeline_shape(request, model_name, factory, tool_fixture, kwargs, name, n_subs):
+    """Test each pipeline factory builds a named SequentialAgent of sub-agents."""
+    pipeline = factory(model_name, request.getfixturevalue(tool_fixture), **kwargs)
 
-        assert pipeline.name == "author_pipeline"
+    assert isinstance(pipeline, SequentialAgent)
+    assert pipeline.name == name
+    assert len(pipeline.sub_agents) == n_subs
 
 
 # =============================================================================
@@ -183,24 +150,21 @@ class TestAuthorPipeline:
 class TestTripComposerAgent:
     """Tests for create_trip_composer_agent."""
 
-    def test_creates_llm_agent(self, model_name):
+    def test_creates_llm_agent(self, trip_composer_agent):
         """Test that trip composer returns an LlmAgent."""
-        agent = create_trip_composer_agent(model_name)
-
-        assert isinstance(agent, LlmAgent)
+        assert isinstance(trip_composer_agent, LlmAgent)
 
-    def test_agent_has_correct_name(self, model_name):
+    def test_agent_has_correct_name(self, trip_composer_agent):
         """Test agent has expected name."""
-        agent = create_trip_composer_agent(model_name)
-
-        assert agent.name == "trip_composer"
+        assert trip_composer_agent.name == "trip_composer"
 
-    def test_agent_has_output_schema(self, model_name):
+    def test_agent_has_output_schema(self, trip_composer_agent):
         """Test agent has Pydantic output schema configured."""
-        agent = create_trip_composer_agent(model_name)
-
         # Should have output_schema or output_key set for Pydantic validation
-        assert hasattr(agent, 'output_schema') or hasattr(agent, 'output_key')
+        assert (
+            getattr(trip_composer_agent, 'output_schema', None) is not None
+            or getattr(trip_composer_agent, 'output_key', None) is not None
+        )
 
 
 # =============================================================================
@@ -210,58 +174,21 @@ class TestTripComposerAgent:
 class TestReaderProfileAgent:
     """Tests for create_reader_profile_agent."""
 
-    def test_creates_llm_agent(self, model_name):
+    def test_creates_llm_agent(self, reader_profile_agent):
         """Test that reader profile returns an LlmAgent."""
-        agent = create_reader_profile_agent(model_name)
+        assert isinstance(reader_profile_agent, LlmAgent)
 
-        assert isinstance(agent, LlmAgent)
-
-    def test_agent_has_correct_name(self, model_name):
+    def test_agent_has_correct_name(self, reader_profile_agent):
         """Test agent has expected name."""
-        agent = create_reader_profile_agent(model_name)
-
-        assert agent.name == "reader_profile_agent"
+        assert reader_profile_agent.name == "reader_profile_agent"
 
-    def test_agent_has_tools(self, model_name):
+    def test_agent_has_tools(self, reader_profile_agent):
         """Test agent has preference tool configured."""
-        agent = create_reader_profile_agent(model_name)
-
         # Should have tools for reading preferences
-        assert hasattr(agent, 'tools')
-        assert len(agent.tools) > 0
+        assert hasattr(reader_profile_agent, 'tools')
+        assert len(reader_profile_agent.tools) > 0
 
 
-# =============================================================================
-# Workflow Orchestrator Tests
-# =============================================================================
-# Metadata Stage Tests (Two-Phase Workflow)
-# =============================================================================
-
-class TestMetadataStage:
-    """Tests for create_metadata_stage."""
-
-    def test_creates_sequential_agent(self, model_name, mock_google_books_tool):
-        """Test that metadata stage returns a SequentialAgent."""
-        stage = create_metadata_stage(model_name, mock_google_books_tool)
-
-        assert isinstance(stage, SequentialAgent)
-
-    def test_stage_has_correct_name(self, model_name, mock_google_books_tool):
-        """Test metadata stage has expected name."""
-        stage = create_metadata_stage(model_name, mock_google_books_tool)
-
-        assert stage.name == "metadata_stage"
-
-    def test_stage_contains_metadata_pipeline(self, model_name, mock_google_books_tool):
-        """Test metadata stage contains book_metadata_pipeline."""
-        stage = create_metadata_stage(model_name, mock_google_books_tool)
-
-        assert len(stage.sub_agents) == 1
-        assert stage.sub_agents[0].name == "book_metadata_pipeline"
-
-
-# =============================================================================
-# Main Workflow Tests (Two-Phase Workflow)
 # =============================================================================
 # Region Analyzer Agent Tests
 # =============================================================================
@@ -269,184 +196,73 @@ class TestMetadataStage:
 class TestRegionAnalyzerAgent:
     """Tests for create_region_analyzer_agent."""
 
-    def test_creates_llm_agent(self, model_name):
+    def test_creates_llm_agent(self, region_analyzer_agent):
         """Test that region analyzer returns an LlmAgent."""
-        agent = create_region_analyzer_agent(model_name)
-
-        assert isinstance(agent, LlmAgent)
+        assert isinstance(region_analyzer_agent, LlmAgent)
 
-    def test_agent_has_correct_name(self, model_name):
+    def test_agent_has_correct_name(self, region_analyzer_agent):
         """Test agent has expected name."""
-        agent = create_region_analyzer_agent(model_name)
-
-        assert agent.name == "region_analyzer"
+        assert region_analyzer_agent.name == "region_analyzer"
 
-    def test_agent_has_output_schema(self, model_name):
+    def test_agent_has_output_schema(self, region_analyzer_agent):
         """Test agent has Pydantic output schema configured."""
-        agent = create_region_analyzer_agent(model_name)
-
-        assert hasattr(agent, 'output_schema') or hasattr(agent, 'output_key')
-
-    def test_agent_has_output_key(self, model_name):
-        """Test agent stores output in region_analysis key."""
-        agent = create_region_analyzer_agent(model_name)
-
-        assert agent.output_key == "region_analysis"
-
-
-# =============================================================================
-# Discovery Workflow Tests (Three-Phase Workflow)
-# =============================================================================
-
-class TestDiscoveryWorkflow:
-    """Tests for create_discovery_workflow."""
-
-    def test_creates_sequential_agent(self, model_name):
-        """Test that discovery workflow returns a SequentialAgent."""
-        workflow = create_discovery_workflow(
-            model_name, book_title="1984", author="George Orwell"
+        assert (
+            getattr(region_analyzer_agent, 'output_schema', None) is not None
+            or getattr(region_analyzer_agent, 'output_key', None) is not None
         )
 
-        assert isinstance(workflow, SequentialAgent)
-
-    def test_workflow_has_correct_name(self, model_name):
-        """Test discovery workflow has expected name."""
-        workflow = create_discovery_workflow(
-            model_name, book_title="1984", author="George Orwell"
-        )
-
-        assert workflow.name == "discovery_workflow"
-
-    def test_workflow_has_four_stages(self, model_name):
-        """Test discovery workflow has 4 stages."""
-        workflow = create_discovery_workflow(
-            model_name, book_title="1984", author="George Orwell"
-        )
-
-        # book_context, reader_profile, parallel_discovery, region_analyzer
-        assert len(workflow.sub_agents) == 4
-
-    def test_workflow_ends_with_region_analyzer(self, model_name):
-        """Test discovery workflow ends with region_analyzer."""
-        workflow = create_discovery_workflow(
-            model_name, book_title="1984", author="George Orwell"
-        )
-
-        stage_names = [agent.name for agent in workflow.sub_agents]
-        assert stage_names[-1] == "region_analyzer"
-
-    def test_workflow_stages_order(self, model_name):
-        """Test discovery workflow stages are in correct order."""
-        workflow = create_discovery_workflow(
-            model_name, book_title="1984", author="George Orwell"
-        )
-
-        stage_names = [agent.name for agent in workflow.sub_agents]
-
-        assert stage_names[0] == "book_context_pipeline"
-        assert stage_names[1] == "reader_profile_agent"
-        assert stage_names[2] == "parallel_discovery"
-        assert stage_names[3] == "region_analyzer"
-
-    def test_workflow_contains_parallel_agent(self, model_name):
-        """Test discovery workflow contains a ParallelAgent for discovery."""
-        workflow = create_discovery_workflow(
-            model_name, book_title="1984", author="George Orwell"
-        )
-
-        parallel_agents = [
-            agent for agent in workflow.sub_agents
-            if isinstance(agent, ParallelAgent)
-        ]
-        assert len(parallel_agents) == 1
-        assert parallel_agents[0].name == "parallel_discovery"
-
-
-# =============================================================================
-# Composition Workflow Tests (Three-Phase Workflow)
-# =============================================================================
-
-class TestCompositionWorkflow:
-    """Tests for create_composition_workflow."""
-
-    def test_creates_sequential_agent(self, model_name):
-        """Test that composition workflow returns a SequentialAgent."""
-        workflow = create_composition_workflow(model_name)
-
-        assert isinstance(workflow, SequentialAgent)
-
-    def test_workflow_has_correct_name(self, model_name):
-        """Test composition workflow has expected name."""
-        workflow = create_composition_workflow(model_name)
-
-        assert workflow.name == "composition_workflow"
-
-    def test_workflow_has_one_stage(self, model_name):
-        """Test composition workflow has 1 stage (trip_composer only)."""
-        workflow = create_composition_workflow(model_name)
-
-        assert len(workflow.sub_agents) == 1
-
-    def test_workflow_contains_trip_composer(self, model_name):
-        """Test composition workflow contains trip_composer agent."""
-        workflow = create_composition_workflow(model_name)
-
-        assert workflow.sub_agents[0].name == "trip_composer"
+    def test_agent_has_output_key(self, region_analyzer_agent):
+        """Test agent stores output in region_analysis key."""
+        assert region_analyzer_agent.output_key == "region_analysis"
 
 
 # =============================================================================
-# Eval Workflow Tests (For ADK Evals)
+# Stage and Workflow Contract Tests
 # =============================================================================
 
-class TestEvalWorkflow:
-    """Tests for create_eval_workflow (used by ADK evals and web UI)."""
-
-    def test_creates_sequential_agent(self, model_name, mock_google_books_tool):
-        """Test that eval workflow returns a SequentialAgent."""
-        workflow = create_eval_workflow(model_name, mock_google_books_tool)
-
-        assert isinstance(workflow, SequentialAgent)
-
-    def test_workflow_has_correct_name(self, model_name, mock_google_books_tool):
-        """Test eval workflow has expected name."""
-        workflow = create_eval_workflow(model_name, mock_google_books_tool)
-
-        assert workflow.name == "eval_workflow"
-
-    def test_workflow_has_six_stages(self, model_name, mock_google_books_tool):
-        """Test eval workflow has 6 stages (metadata, context, profile, discovery, region_analyzer, composer)."""
-        workflow = create_eval_workflow(model_name, mock_google_books_tool)
-
-        # Should have 6 stages: metadata, context, reader_profile, parallel_discovery, region_analyzer, trip_composer
-        assert len(workflow.sub_agents) == 6
-
-    def test_workflow_stage_order(self, model_name, mock_google_books_tool):
-        """Test eval workflow stages are in correct order."""
-        workflow = create_eval_workflow(model_name, mock_google_books_tool)
-
-        stage_names = [agent.name for agent in workflow.sub_agents]
-        assert stage_names[0] == "book_metadata_pipeline"
-        assert stage_names[1] == "book_context_pipeline"
-        assert stage_names[2] == "reader_profile_agent"
-        assert stage_names[3] == "parallel_discovery"
-        assert stage_names[4] == "region_analyzer"
-        assert stage_names[5] == "trip_composer"
-
-    def test_workflow_contains_parallel_agent(self, model_name, mock_google_books_tool):
-        """Test eval workflow contains a ParallelAgent for discovery."""
-        workflow = create_eval_workflow(model_name, mock_google_books_tool)
-
-        parallel_agents = [
-            agent for agent in workflow.sub_agents
-            if isinstance(agent, ParallelAgent)
-        ]
-        assert len(parallel_agents) == 1
-        assert parallel_agents[0].name == "parallel_discovery"
-
-    def test_workflow_includes_region_analyzer(self, model_name, mock_google_books_tool):
-        """Test eval workflow includes region analyzer before trip composer."""
-        workflow = create_eval_workflow(model_name, mock_google_books_tool)
-
-        # Region analyzer should be at index 4 (before trip_composer)
-        assert workflow.sub_agents[4].name == "region_analyzer"
-        assert workflow.sub_agents[5].name == "trip_composer"
+WORKFLOW_CASES = [
+    # (workflow fixture, expected name, sub-agent names in order)
+    ("metadata_stage", "metadata_stage", ("book_metadata_pipeline",)),
+    ("discovery_workflow", "discovery_workflow", (
+        "book_context_pipeline",
+        "reader_profile_agent",
+        "parallel_discovery",
+        "region_analyzer",
+    )),
+    ("composition_workflow", "composition_workflow", ("trip_composer",)),
+    ("eval_workflow", "eval_workflow", (
+        "book_metadata_pipeline",
+        "book_context_pipeline",
+        "reader_profile_agent",
+        "parallel_discovery",
+        "region_analyzer",
+        "trip_composer",
+    )),
+]
+
+
+@pytest.mark.parametrize(
+    "workflow_fixture,name,stage_names",
+    WORKFLOW_CASES,
+    ids=[case[0] for case in WORKFLOW_CASES],
+)
+def test_workflow_contract(request, workflow_fixture, name, stage_names):
+    """Test each stage/workflow is a named SequentialAgent with stages in order."""
+    workflow = request.getfixturevalue(workflow_fixture)
+
+    assert isinstance(workflow, SequentialAgent)
+    assert workflow.name == name
+    assert tuple(agent.name for agent in workflow.sub_agents) == stage_names
+
+
+@pytest.mark.parametrize("workflow_fixture", ["discovery_workflow", "eval_workflow"])
+def test_workflow_contains_parallel_agent(request, workflow_fixture):
+    """Test discovery runs under a single ParallelAgent."""
+    workflow = request.getfixturevalue(workflow_fixture)
+    stages = _index_sub_agents(workflow)
+
+    assert isinstance(stages["parallel_discovery"], ParallelAgent)
+    assert sum(isinstance(agent, ParallelAgent) for agent in stages.values()) == 1
+    assert set(_index_sub_agents(stages["parallel_discovery"])) == {
+        "city_pipeline", "landmark_pipeline", "author_pipeline"
+    }
@@ -18,6 +18,52 @@ from models.itinerary import TripItinerary, CityPlan, CityStop
 from models.preferences import TravelPreferences
 
 
+# Literal values TravelPreferences accepts
+_VALID_BUDGETS = frozenset({"budget", "moderate", "luxury"})
+_VALID_PACES = frozenset({"relaxed", "moderate", "fast-paced"})
+
+# Valid fields apart from the one a test varies
+_CITY_PLAN = {"name": "City", "country": "Country", "overview": "Overview", "stops": []}
+_REGION_OPTION = {
+    "region_id": 1,
+    "region_name": "Test",
+    "cities": [],
+    "travel_note": "Note",
+    "highlights": "Highlights",
+}
+
+
+@pytest.fixture(scope="module")
+def city_stop_kwargs():
+    """CityStop fields held constant while a test varies time_of_day."""
+    return {"name": "Place", "type": "landmark", "reason": "Reason"}
+
+
+@pytest.fixture(scope="module")
+def city_plan_kwargs():
+    """CityPlan fields held constant while a test varies days_suggested."""
+    return _CITY_PLAN
+
+
+# Serialized once per module; round-trip tests re-parse these
+@pytest.fixture(scope="module")
+def trip_itinerary_json(sample_trip_itinerary):
+    """JSON for sample_trip_itinerary."""
+    return sample_trip_itinerary.model_dump_json()
+
+
+@pytest.fixture(scope="module")
+def region_option_json(sample_region_option):
+    """JSON for sample_region_option."""
+    return sample_region_option.model_dump_json()
+
+
+@pytest.fixture(scope="module")
+def region_analysis_json(sample_region_analysis):
+    """JSON for sample_region_analysis."""
+    return sample_region_analysis.model_dump_json()
+
+
 # =============================================================================
 # BookMetadata Tests
 # =============================================================================
@@ -47,11 +93,6 @@ class TestBookMetadata:
         assert "Pride and Prejudice" in json_str
         assert "Jane Austen" in json_str
 
-    def test_book_metadata_missing_required_fields(self):
-        """Test BookMetadata fails without required fields."""
-        with pytest.raises(ValidationError):
-            BookMetadata(book_title="Only Title")
-
     def test_book_metadata_from_dict(self):
         """Test creating BookMetadata from dictionary."""
         data = {
@@ -59,7 +100,7 @@ class TestBookMetadata:
             "author": "Author",
             "categories": ["Fiction"]
         }
-        metadata = BookMetadata(**data)
+        metadata = BookMetadata.model_validate(data)
         assert metadata.categories == ["Fiction"]
 
 
@@ -75,15 +116,6 @@ class TestBookContext:
         assert "Hertfordshire, England" in sample_book_context.primary_locations
         assert "Regency" in sample_book_context.time_period
 
-    def test_book_context_required_fields(self):
-        """Test BookContext requires all fields."""
-        with pytest.raises(ValidationError):
-            BookContext(
-                primary_locations=["London"],
-                time_period="19th century"
-                # Missing themes
-            )
-
     def test_book_context_empty_locations(self):
         """Test BookContext with empty locations list."""
         context = BookContext(
@@ -164,15 +196,6 @@ class TestLandmarkDiscovery:
         assert len(sample_landmark_discovery.landmarks) == 2
         assert "Chatsworth" in sample_landmark_discovery.landmarks[0].name
 
-    def test_landmark_info_required_fields(self):
-        """Test LandmarkInfo requires all fields."""
-        with pytest.raises(ValidationError):
-            LandmarkInfo(
-                name="Tower",
-                city="London"
-                # Missing connection
-            )
-
 
 # =============================================================================
 # AuthorSites Tests
@@ -218,16 +241,11 @@ class TestCityStop:
         )
         assert stop.notes is None
 
-    def test_city_stop_all_time_of_day_values(self):
+    @pytest.mark.parametrize("time", ["morning", "afternoon", "evening", "full_day"])
+    def test_city_stop_all_time_of_day_values(self, city_stop_kwargs, time):
         """Test CityStop accepts various time_of_day values."""
-        for time in ["morning", "afternoon", "evening", "full_day"]:
-            stop = CityStop(
-                name="Place",
-                type="landmark",
-                reason="Reason",
-                time_of_day=time
-            )
-            assert stop.time_of_day == time
+        stop = CityStop(**city_stop_kwargs, time_of_day=time)
+        assert stop.time_of_day == time
 
 
 # =============================================================================
@@ -243,39 +261,11 @@ class TestCityPlan:
         assert sample_city_plan.days_suggested == 2
         assert len(sample_city_plan.stops) == 1
 
-    def test_city_plan_days_validation_min(self):
-        """Test CityPlan days_suggested minimum is 1."""
-        with pytest.raises(ValidationError):
-            CityPlan(
-                name="City",
-                country="Country",
-                days_suggested=0,  # Invalid: must be >= 1
-                overview="Overview",
-                stops=[]
-            )
-
-    def test_city_plan_days_validation_max(self):
-        """Test CityPlan days_suggested maximum is 7."""
-        with pytest.raises(ValidationError):
-            CityPlan(
-                name="City",
-                country="Country",
-                days_suggested=10,  # Invalid: must be <= 7
-                overview="Overview",
-                stops=[]
-            )
-
-    def test_city_plan_valid_days_range(self):
+    @pytest.mark.parametrize("days", range(1, 8))  # 1 to 7
+    def test_city_plan_valid_days_range(self, city_plan_kwargs, days):
         """Test CityPlan accepts valid days_suggested values."""
-        for days in range(1, 8):  # 1 to 7
-            plan = CityPlan(
-                name="City",
-                country="Country",
-                days_suggested=days,
-                overview="Overview",
-                stops=[]
-            )
-            assert plan.days_suggested == days
+        plan = CityPlan(**city_plan_kwargs, days_suggested=days)
+        assert plan.days_suggested == days
 
 
 # =============================================================================
@@ -298,10 +288,10 @@ class TestTripItinerary:
         )
         assert itinerary.cities == []
 
-    def test_trip_itinerary_serialization(self, sample_trip_itinerary):
+    def test_trip_itinerary_serialization(self, sample_trip_itinerary, trip_itinerary_json):
         """Test TripItinerary serialization round-trip."""
-        json_data = sample_trip_itinerary.model_dump()
-        restored = TripItinerary(**json_data)
+        restored = TripItinerary.model_validate_json(trip_itinerary_json)
+        assert restored == sample_trip_itinerary
         assert restored.summary_text == sample_trip_itinerary.summary_text
         assert len(restored.cities) == len(sample_trip_itinerary.cities)
 
@@ -327,31 +317,21 @@ class TestTravelPreferences:
         assert prefs.preferred_pace == "moderate"
         assert prefs.accessibility_needs is False
 
-    def test_preferences_budget_validation(self):
-        """Test TravelPreferences budget must be valid literal."""
-        with pytest.raises(ValidationError):
-            TravelPreferences(budget="cheap")  # Invalid: not in Literal
-
-    def test_preferences_valid_budget_values(self):
+    @pytest.mark.parametrize("budget", sorted(_VALID_BUDGETS))
+    def test_preferences_valid_budget_values(self, budget):
         """Test all valid budget values."""
-        for budget in ["budget", "moderate", "luxury"]:
-            prefs = TravelPreferences(budget=budget)
-            assert prefs.budget == budget
-
-    def test_preferences_pace_validation(self):
-        """Test TravelPreferences pace must be valid literal."""
-        with pytest.raises(ValidationError):
-            TravelPreferences(preferred_pace="slow")  # Invalid
+        prefs = TravelPreferences(budget=budget)
+        assert prefs.budget == budget
 
-    def test_preferences_valid_pace_values(self):
+    @pytest.mark.parametrize("pace", sorted(_VALID_PACES))
+    def test_preferences_valid_pace_values(self, pace):
         """Test all valid pace values."""
-        for pace in ["relaxed", "moderate", "fast-paced"]:
-            prefs = TravelPreferences(preferred_pace=pace)
-            assert prefs.preferred_pace == pace
+        prefs = TravelPreferences(preferred_pace=pace)
+        assert prefs.preferred_pace == pace
 
     def test_preferences_from_dict(self, sample_preferences_dict):
         """Test creating TravelPreferences from dictionary."""
-        prefs = TravelPreferences(**sample_preferences_dict)
+        prefs = TravelPreferences.model_validate(sample_preferences_dict)
         assert prefs.budget == "moderate"
         assert "Jane Austen" in prefs.favorite_authors
 
@@ -369,16 +349,6 @@ class TestRegionCity:
         assert city.name == "Boston"
         assert city.country == "USA"
 
-    def test_region_city_requires_name(self):
-        """Test RegionCity requires name field."""
-        with pytest.raises(ValidationError):
-            RegionCity(country="USA")
-
-    def test_region_city_requires_country(self):
-        """Test RegionCity requires country field."""
-        with pytest.raises(ValidationError):
-            RegionCity(name="Boston")
-
 
 # =============================================================================
 # RegionOption Tests
@@ -405,30 +375,6 @@ class TestRegionOption:
         assert len(region.cities) == 2
         assert region.estimated_days == 5
 
-    def test_region_option_days_validation_min(self):
-        """Test RegionOption estimated_days minimum is 1."""
-        with pytest.raises(ValidationError):
-            RegionOption(
-                region_id=1,
-                region_name="Test",
-                cities=[],
-                estimated_days=0,  # Invalid: must be >= 1
-                travel_note="Note",
-                highlights="Highlights",
-            )
-
-    def test_region_option_days_validation_max(self):
-        """Test RegionOption estimated_days maximum is 30."""
-        with pytest.raises(ValidationError):
-            RegionOption(
-                region_id=1,
-                region_name="Test",
-                cities=[],
-                estimated_days=31,  # Invalid: must be <= 30
-                travel_note="Note",
-                highlights="Highlights",
-            )
-
     def test_region_option_empty_cities(self):
         """Test RegionOption with empty cities list."""
         region = RegionOption(
@@ -441,19 +387,11 @@ class TestRegionOption:
         )
         assert region.cities == []
 
-    def test_region_option_serialization(self):
+    def test_region_option_serialization(self, sample_region_option, region_option_json):
         """Test RegionOption serialization round-trip."""
-        region = RegionOption(
-            region_id=1,
-            region_name="Test Region",
-            cities=[RegionCity(name="City", country="Country")],
-            estimated_days=3,
-            travel_note="Note",
-            highlights="Highlights",
-        )
-        json_data = region.model_dump()
-        restored = RegionOption(**json_data)
-        assert restored.region_name == region.region_name
+        restored = RegionOption.model_validate_json(region_option_json)
+        assert restored == sample_region_option
+        assert restored.region_name == sample_region_option.region_name
         assert len(restored.cities) == 1
 
 
@@ -498,22 +436,54 @@ class TestRegionAnalysis:
         )
         assert analysis.regions == []
 
-    def test_region_analysis_serialization(self):
+    def test_region_analysis_serialization(self, sample_region_analysis, region_analysis_json):
         """Test RegionAnalysis JSON serialization round-trip."""
-        analysis = RegionAnalysis(
-            regions=[
-                RegionOption(
-                    region_id=1,
-                    region_name="Test",
-                    cities=[],
-                    estimated_days=1,
-                    travel_note="Note",
-                    highlights="Highlights",
-                )
-            ],
-            analysis_note="Test analysis",
-        )
-        json_data = analysis.model_dump()
-        restored = RegionAnalysis(**json_data)
+        restored = RegionAnalysis.model_validate_json(region_analysis_json)
+        assert restored == sample_region_analysis
         assert len(restored.regions) == 1
-        assert restored.analysis_note == analysis.analysis_note
+        assert restored.analysis_note == sample_region_analysis.analysis_note
+
+
+# =============================================================================
+# Validation Failure Tests
+# =============================================================================
+
+VALIDATION_FAILURES = [
+    # (id, model, kwargs, expected [(loc, error type)])
+    ("book_metadata_missing_author", BookMetadata, {"book_title": "Only Title"},
+     [(("author",), "missing")]),
+    ("book_context_missing_themes", BookContext,
+     {"primary_locations": ["London"], "time_period": "19th century"},
+     [(("themes",), "missing")]),
+    ("landmark_info_missing_connection", LandmarkInfo, {"name": "Tower", "city": "London"},
+     [(("connection",), "missing")]),
+    ("city_plan_days_below_min", CityPlan, {**_CITY_PLAN, "days_suggested": 0},
+     [(("days_suggested",), "greater_than_equal")]),
+    ("city_plan_days_above_max", CityPlan, {**_CITY_PLAN, "days_suggested": 10},
+     [(("days_suggested",), "less_than_equal")]),
+    ("preferences_invalid_budget", TravelPreferences, {"budget": "cheap"},
+     [(("budget",), "literal_error")]),
+    ("preferences_invalid_pace", TravelPreferences, {"preferred_pace": "slow"},
+     [(("preferred_pace",), "literal_error")]),
+    ("region_city_missing_name", RegionCity, {"country": "USA"},
+     [(("name",), "missing")]),
+    ("region_city_missing_country", RegionCity, {"name": "Boston"},
+     [(("country",), "missing")]),
+    ("region_option_days_below_min", RegionOption, {**_REGION_OPTION, "estimated_days": 0},
+     [(("estimated_days",), "greater_than_equal")]),
+    ("region_option_days_above_max", RegionOption, {**_REGION_OPTION, "estimated_days": 31},
+     [(("estimated_days",), "less_than_equal")]),
+]
+
+
+@pytest.mark.parametrize(
+    "model,kwargs,expected",
+    [case[1:] for case in VALIDATION_FAILURES],
+    ids=[case[0] for case in VALIDATION_FAILURES],
+)
+def test_validation_error(model, kwargs, expected):
+    """Test invalid input fails validation on the expected field, for the expected reason."""
+    with pytest.raises(ValidationError, match=expected[0][0][0]) as exc_info:
+        model(**kwargs)
+    errors = exc_info.value.errors(include_url=False)
+    assert [(err["loc"], err["type"]) for err in errors] == expected
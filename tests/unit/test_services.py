@@ -4,13 +4,16 @@ Unit tests for services.
 Tests session service factory and context manager functionality.
 """
 
+import importlib
 import os
 import pytest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 from services.session_service import (
     create_session_service,
-    create_session_service_from_env
+    create_session_service_from_env,
+    reload_env,
 )
 
 
@@ -46,8 +49,9 @@ class TestCreateSessionService:
 
         assert "Database" in type(service).__name__
 
-    def test_create_database_service_default_path(self):
+    def test_create_database_service_default_path(self, tmp_path, monkeypatch):
         """Test DatabaseSessionService uses default path when not provided."""
+        monkeypatch.chdir(tmp_path)  # The default path is relative to the cwd
         service = create_session_service(use_database=True)
 
         assert "Database" in type(service).__name__
@@ -61,10 +65,26 @@ class TestCreateSessionService:
 
         assert "InMemory" in type(service).__name__
 
+    def test_create_session_service_reuses_instance_per_config(self, tmp_path):
+        """Test equivalent configurations share one cached service."""
+        assert create_session_service() is create_session_service(use_database=False)
+
+        db_url = f"sqlite:///{tmp_path}/cached.db"
+        db_service = create_session_service(connection_string=db_url, use_database=True)
+        assert db_service is create_session_service(db_url, True)
+        assert db_service is not create_session_service()
+
 
 class TestCreateSessionServiceFromEnv:
     """Tests for create_session_service_from_env function."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_env(self, tmp_path, monkeypatch):
+        """Drop the parsed env config so each test reads its patched environment."""
+        monkeypatch.setattr("services.session_service._CACHED_CFG", None)
+        # Relative sqlite URLs (including the default) land in tmp_path
+        monkeypatch.chdir(tmp_path)
+
     @patch.dict(os.environ, {}, clear=True)
     def test_from_env_defaults_to_in_memory(self):
         """Test defaults to in-memory when env vars not set."""
@@ -107,31 +127,72 @@ class TestCreateSessionServiceFromEnv:
 
         assert "Database" in type(service).__name__
 
+    def test_from_env_reuses_parsed_config_until_reload(self, tmp_path, monkeypatch):
+        """Test env changes are picked up only after reload_env()."""
+        monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path}/reload.db")
+        with patch.dict(os.environ, {'USE_DATABASE': 'false'}):
+            reload_env()
+            assert "InMemory" in type(create_session_service_from_env()).__name__
+
+            os.environ['USE_DATABASE'] = 'true'
+            assert "InMemory" in type(create_session_service_from_env()).__name__
+
+            reload_env()
+            assert "Database" in type(create_session_service_from_env()).__name__
+
+
+class TestPackageExports:
+    """Tests for the lazily-resolved services and tools package exports."""
+
+    @pytest.mark.parametrize("package, name, submodule", [
+        ("services", "ContextManager", "services.context_manager"),
+        ("services", "create_session_service", "services.session_service"),
+        ("tools", "search_book", "tools.google_books"),
+        ("tools", "get_preferences_tool", "tools.preferences"),
+    ])
+    def test_export_resolves_to_submodule_object(self, package, name, submodule):
+        """Test a package attribute is the defining submodule's object."""
+        exported = getattr(importlib.import_module(package), name)
+
+        assert exported is getattr(importlib.import_module(submodule), name)
+
+    @pytest.mark.parametrize("package", ["services", "tools"])
+    def test_unknown_attribute_raises(self, package):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            importlib.import_module(package).not_an_export
+
 
 # =============================================================================
 # Context Manager Tests (if context_manager.py exists)
 # =============================================================================
 
+ContextManager = pytest.importorskip("services.context_manager").ContextManager
+
+
+@pytest.fixture(scope="session")
+def dict_events():
+    """25 read-only dict events ("Event 0".."Event 24"); slice for fewer."""
+    return tuple({"content": f"Event {i}"} for i in range(25))
+
+
+def _text_event(text: str):
+    """Build a minimal event-like object with a single text part."""
+    return SimpleNamespace(content=SimpleNamespace(parts=[SimpleNamespace(text=text)]))
+
+
 class TestContextManager:
     """Tests for ContextManager service."""
 
     @pytest.fixture
     def context_manager(self):
         """Create a ContextManager instance with max_events only."""
-        try:
-            from services.context_manager import ContextManager
-            return ContextManager(max_events=20)
-        except ImportError:
-            pytest.skip("ContextManager not available")
+        return ContextManager(max_events=20)
 
     @pytest.fixture
     def context_manager_with_tokens(self):
         """Create a ContextManager instance with token limit."""
-        try:
-            from services.context_manager import ContextManager
-            return ContextManager(max_events=20, max_tokens=1000)
-        except ImportError:
-            pytest.skip("ContextManager not available")
+        return ContextManager(max_events=20, max_tokens=1000)
 
     def test_context_manager_initialization(self, context_manager):
         """Test ContextManager initializes with max_events."""
@@ -141,17 +202,21 @@ class TestContextManager:
         """Test ContextManager initializes with max_tokens."""
         assert context_manager_with_tokens.max_tokens == 1000
 
-    def test_limit_events_within_limit(self, context_manager):
+    def test_context_manager_has_no_instance_dict(self, context_manager):
+        """Test ContextManager uses __slots__ instead of a per-instance dict."""
+        assert not hasattr(context_manager, "__dict__")
+
+    def test_limit_events_within_limit(self, context_manager, dict_events):
         """Test limit_events when events are within limit."""
-        events = [{"content": f"Event {i}"} for i in range(5)]
+        events = dict_events[:5]
 
         limited = context_manager.limit_events(events, num_recent=10)
 
         assert len(limited) == 5
 
-    def test_limit_events_exceeds_limit(self, context_manager):
+    def test_limit_events_exceeds_limit(self, context_manager, dict_events):
         """Test limit_events when events exceed limit."""
-        events = [{"content": f"Event {i}"} for i in range(20)]
+        events = dict_events[:20]
 
         limited = context_manager.limit_events(events, num_recent=5)
 
@@ -159,6 +224,15 @@ class TestContextManager:
         # Should keep the most recent events
         assert limited[-1]["content"] == "Event 19"
 
+    def test_iter_recent_yields_last_events(self, context_manager, dict_events):
+        """Test iter_recent yields the most recent events in order."""
+        events = dict_events[:20]
+
+        recent = tuple(context_manager.iter_recent(events, num_recent=3))
+
+        assert recent == events[-3:]
+        assert tuple(context_manager.iter_recent(events, num_recent=50)) == events
+
     def test_should_compact_returns_bool(self, context_manager):
         """Test should_compact returns boolean based on event count."""
         # Create events below the limit
@@ -166,9 +240,118 @@ class TestContextManager:
         result = context_manager.should_compact(events)
         assert result is False
 
-    def test_should_compact_exceeds_max_events(self, context_manager):
+    def test_should_compact_exceeds_max_events(self, context_manager, dict_events):
         """Test should_compact returns True when exceeding max_events."""
-        # Create events exceeding the limit (max_events=20)
-        events = [{"content": f"Event {i}"} for i in range(25)]
-        result = context_manager.should_compact(events)
+        # 25 events exceed the limit (max_events=20)
+        result = context_manager.should_compact(dict_events)
         assert result is True
+
+    def test_check_skips_text_scan_over_max_events(self, context_manager):
+        """Test check short-circuits on event count without measuring text."""
+        events = [_text_event("a" * 40) for _ in range(25)]
+
+        compact, stats = context_manager.check(events)
+
+        assert compact is True
+        assert stats["num_events"] == 25
+        assert stats["total_chars"] is None
+
+    def test_check_returns_stats_within_limits(self, context_manager_with_tokens):
+        """Test check reports full stats when under max_events."""
+        events = [_text_event("a" * 40), _text_event("b" * 20)]
+
+        compact, stats = context_manager_with_tokens.check(events)
+
+        assert compact is False
+        assert stats["total_chars"] == 60
+        assert stats["within_limit"] is True
+
+    def test_append_event_keeps_recent_window(self, context_manager):
+        """Test append_event evicts the oldest events beyond max_events."""
+        events = [_text_event(f"Event {i}") for i in range(25)]
+        for event in events:
+            context_manager.append_event(event)
+
+        recent = context_manager.recent_events()
+        assert len(recent) == 20
+        assert recent[0] is events[5]
+        assert recent[-1] is events[24]
+
+    def test_recent_events_empty_by_default(self, context_manager):
+        """Test a new ContextManager holds no events."""
+        assert len(context_manager.recent_events()) == 0
+
+    def test_get_context_stats_counts_text(self, context_manager, monkeypatch):
+        """Test get_context_stats sums text parts and estimates tokens."""
+        monkeypatch.setattr("services.context_manager._enc", lambda: None)
+        events = [_text_event("a" * 40), _text_event("b" * 20)]
+
+        stats = context_manager.get_context_stats(events)
+
+        assert stats["num_events"] == 2
+        assert stats["total_chars"] == 60
+        assert stats["estimated_tokens"] == 15
+
+    def test_get_context_stats_after_append_and_replace(self, context_manager):
+        """Test stats stay correct when the list grows or is replaced."""
+        events = [_text_event("a" * 40)]
+        context_manager.get_context_stats(events)
+
+        events.append(_text_event("b" * 20))
+        assert context_manager.get_context_stats(events)["total_chars"] == 60
+
+        replaced = [_text_event("c" * 8)]
+        assert context_manager.get_context_stats(replaced)["total_chars"] == 8
+
+    def test_get_context_stats_results_are_independent(self, context_manager):
+        """Test a later stats call does not change earlier results."""
+        first = context_manager.get_context_stats([_text_event("a" * 40)])
+        second = context_manager.get_context_stats([_text_event("b" * 8)])
+
+        assert first["total_chars"] == 40
+        assert second["total_chars"] == 8
+
+    def test_get_context_stats_batch_aligns_with_sessions(
+        self, context_manager, monkeypatch
+    ):
+        """Test batch stats return one entry per session, in order."""
+        monkeypatch.setattr("services.context_manager._enc", lambda: None)
+        sessions = [
+            SimpleNamespace(events=[_text_event("a" * 40), _text_event("b" * 20)]),
+            SimpleNamespace(events=[]),
+            SimpleNamespace(events=[_text_event("c" * 8)]),
+        ]
+
+        batch = context_manager.get_context_stats_batch(sessions)
+
+        assert list(batch["num_events"]) == [2, 0, 1]
+        assert list(batch["total_chars"]) == [60, 0, 8]
+        assert list(batch["estimated_tokens"]) == [15, 0, 2]
+
+    def test_get_context_stats_uses_tokenizer_when_available(
+        self, context_manager, monkeypatch
+    ):
+        """Test estimated_tokens comes from the tokenizer when one is loaded."""
+        word_encoder = SimpleNamespace(encode=lambda text, **kwargs: text.split())
+        monkeypatch.setattr("services.context_manager._enc", lambda: word_encoder)
+        events = [_text_event("one two three"), _text_event("four")]
+
+        stats = context_manager.get_context_stats(events)
+
+        assert stats["total_chars"] == 17
+        assert stats["estimated_tokens"] == 4
+
+    def test_window_stats_track_appends_and_evictions(self, monkeypatch):
+        """Test window stats follow appended and evicted events."""
+        monkeypatch.setattr("services.context_manager._enc", lambda: None)
+        context_manager = ContextManager(max_events=2)
+
+        context_manager.append_event(_text_event("a" * 40))
+        context_manager.append_event(_text_event("b" * 20))
+        assert context_manager.get_context_stats()["total_chars"] == 60
+
+        context_manager.append_event(_text_event("c" * 8))
+        stats = context_manager.get_context_stats()
+        assert stats["num_events"] == 2
+        assert stats["total_chars"] == 28
+        assert stats["estimated_tokens"] == 7
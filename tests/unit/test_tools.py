@@ -8,7 +8,7 @@ import json
 import pytest
 from unittest.mock import patch, MagicMock
 
-from tools.google_books import search_books, search_book, google_books_tool
+from tools.google_books import search_books, search_book, google_books_tool, _fetch_volumes
 from tools.preferences import get_user_preferences, get_preferences_tool
 from models.book import BookInfo, BookMetadata
 
@@ -17,15 +17,33 @@ from models.book import BookInfo, BookMetadata
 # Google Books API Tests
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_google_books_cache():
+    """Start every test with an empty Google Books response cache."""
+    _fetch_volumes.cache_clear()
+    yield
+    _fetch_volumes.cache_clear()
+
+
+@pytest.fixture
+def mock_requests_get():
+    """Patch the HTTP GET used by the Google Books tool."""
+    with patch('tools.google_books._SESSION.get') as mock_get:
+        yield mock_get
+
+
+def _set_json(mock_get, payload):
+    """Make mock_get return a successful response whose body is payload as JSON."""
+    mock_get.return_value = MagicMock(status_code=200, content=json.dumps(payload).encode())
+    return mock_get
+
+
 class TestSearchBooks:
     """Tests for search_books function."""
 
-    @patch('tools.google_books.requests.get')
-    def test_search_books_success(self, mock_get, mock_google_books_response):
+    def test_search_books_success(self, mock_requests_get, mock_google_books_response):
         """Test successful book search."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_google_books_response
-        mock_get.return_value.raise_for_status = MagicMock()
+        _set_json(mock_requests_get, mock_google_books_response)
 
         results = search_books("Pride and Prejudice", "Jane Austen")
 
@@ -33,52 +51,47 @@ class TestSearchBooks:
         assert results[0].title == "Pride and Prejudice"
         assert "Jane Austen" in results[0].authors
 
-    @patch('tools.google_books.requests.get')
-    def test_search_books_empty_results(self, mock_get, mock_google_books_empty_response):
+    def test_search_books_empty_results(self, mock_requests_get, mock_google_books_empty_response):
         """Test search with no results."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_google_books_empty_response
-        mock_get.return_value.raise_for_status = MagicMock()
+        _set_json(mock_requests_get, mock_google_books_empty_response)
 
         results = search_books("Nonexistent Book Title XYZ123")
 
         assert len(results) == 0
 
-    @patch('tools.google_books.requests.get')
-    def test_search_books_with_author(self, mock_get, mock_google_books_response):
+    def test_search_books_with_author(self, mock_requests_get, mock_google_books_response):
         """Test search with author filter."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_google_books_response
-        mock_get.return_value.raise_for_status = MagicMock()
+        _set_json(mock_requests_get, mock_google_books_response)
 
         search_books("Pride", "Austen")
 
         # Verify the query includes both title and author
-        call_args = mock_get.call_args
+        call_args = mock_requests_get.call_args
         assert "intitle:Pride" in call_args[1]['params']['q']
         assert "inauthor:Austen" in call_args[1]['params']['q']
 
-    @patch('tools.google_books.requests.get')
-    def test_search_books_api_error(self, mock_get):
+    def test_search_books_without_title_or_author(self, mock_requests_get):
+        """Test an empty search returns no results without calling the API."""
+        assert search_books("") == []
+        mock_requests_get.assert_not_called()
+
+    def test_search_books_api_error(self, mock_requests_get):
         """Test handling of API errors."""
-        mock_get.return_value.raise_for_status.side_effect = Exception("API Error")
+        mock_requests_get.return_value.raise_for_status.side_effect = Exception("API Error")
 
         with pytest.raises(Exception):
             search_books("Test Book")
 
-    @patch('tools.google_books.requests.get')
-    def test_search_books_handles_missing_fields(self, mock_get):
+    def test_search_books_handles_missing_fields(self, mock_requests_get):
         """Test search handles missing optional fields in API response."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
+        _set_json(mock_requests_get, {
             "items": [{
                 "volumeInfo": {
                     "title": "Minimal Book"
                     # Missing authors, description, etc.
                 }
             }]
-        }
-        mock_get.return_value.raise_for_status = MagicMock()
+        })
 
         results = search_books("Minimal")
 
@@ -87,28 +100,36 @@ class TestSearchBooks:
         assert results[0].authors == []
         assert results[0].description is None
 
-    @patch('tools.google_books.requests.get')
-    def test_search_books_max_results(self, mock_get, mock_google_books_response):
+    def test_search_books_max_results(self, mock_requests_get, mock_google_books_response):
         """Test max_results parameter is passed correctly."""
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = mock_google_books_response
-        mock_get.return_value.raise_for_status = MagicMock()
+        _set_json(mock_requests_get, mock_google_books_response)
 
         search_books("Test", max_results=3)
 
-        call_args = mock_get.call_args
+        call_args = mock_requests_get.call_args
         assert call_args[1]['params']['maxResults'] == 3
 
+    def test_search_books_caches_repeat_queries(self, mock_requests_get, mock_google_books_response):
+        """Test identical searches reuse the cached response."""
+        _set_json(mock_requests_get, mock_google_books_response)
+
+        first = search_books("Pride and Prejudice", "Jane Austen")
+        second = search_books("Pride and Prejudice", "Jane Austen")
+        search_books("Emma", "Jane Austen")
+
+        assert first == second
+        assert mock_requests_get.call_count == 2
+
 
 class TestSearchBook:
     """Tests for search_book function (returns JSON string)."""
 
     @patch('tools.google_books.search_books')
-    def test_search_book_success(self, mock_search, sample_book_info_list):
+    async def test_search_book_success(self, mock_search, sample_book_info_list):
         """Test successful book search returns valid JSON."""
         mock_search.return_value = sample_book_info_list
 
-        result = search_book("Pride and Prejudice", "Jane Austen")
+        result = await search_book("Pride and Prejudice", "Jane Austen")
 
         # Should be valid JSON
         data = json.loads(result)
@@ -116,45 +137,45 @@ class TestSearchBook:
         assert data['author'] == "Jane Austen"
 
     @patch('tools.google_books.search_books')
-    def test_search_book_returns_pydantic_validated_json(self, mock_search, sample_book_info_list):
+    async def test_search_book_returns_pydantic_validated_json(self, mock_search, sample_book_info_list):
         """Test search_book returns Pydantic-validated JSON."""
         mock_search.return_value = sample_book_info_list
 
-        result = search_book("Pride and Prejudice")
+        result = await search_book("Pride and Prejudice")
 
         # Should be parseable as BookMetadata
         data = json.loads(result)
-        metadata = BookMetadata(**data)
+        metadata = BookMetadata.model_validate(data)
         assert metadata.book_title == "Pride and Prejudice"
 
     @patch('tools.google_books.search_books')
-    def test_search_book_no_results(self, mock_search):
+    async def test_search_book_no_results(self, mock_search):
         """Test search_book with no results returns error JSON."""
         mock_search.return_value = []
 
-        result = search_book("Nonexistent Book")
+        result = await search_book("Nonexistent Book")
 
         data = json.loads(result)
         assert "error" in data
         assert data['error'] == "No books found"
 
     @patch('tools.google_books.search_books')
-    def test_search_book_exception(self, mock_search):
+    async def test_search_book_exception(self, mock_search):
         """Test search_book handles exceptions gracefully."""
         mock_search.side_effect = Exception("Network error")
 
-        result = search_book("Test Book")
+        result = await search_book("Test Book")
 
         data = json.loads(result)
         assert "error" in data
         assert "Network error" in data['error']
 
     @patch('tools.google_books.search_books')
-    def test_search_book_selects_first_result(self, mock_search, sample_book_info_list):
+    async def test_search_book_selects_first_result(self, mock_search, sample_book_info_list):
         """Test search_book selects the first/best result."""
         mock_search.return_value = sample_book_info_list
 
-        result = search_book("Pride")
+        result = await search_book("Pride")
 
         data = json.loads(result)
         # Should select first result, not "Pride and Prejudice and Zombies"
@@ -196,13 +217,17 @@ class TestGetUserPreferences:
         assert data['preferences'] == {}
         assert "No user preferences found" in data['message']
 
-    def test_get_preferences_returns_valid_json(self, mock_tool_context):
-        """Test that get_user_preferences always returns valid JSON."""
-        result = get_user_preferences(mock_tool_context)
+    @pytest.mark.parametrize(
+        "context_fixture", ["mock_tool_context", "mock_tool_context_no_preferences"]
+    )
+    def test_get_preferences_returns_valid_json(self, request, context_fixture):
+        """Test that get_user_preferences always returns a JSON object."""
+        result = get_user_preferences(request.getfixturevalue(context_fixture))
 
         # Should not raise
         data = json.loads(result)
         assert isinstance(data, dict)
+        assert {"found", "preferences"} <= data.keys()
 
 
 class TestGetPreferencesTool:
@@ -6,7 +6,6 @@ Tests the WorkflowTimeoutError and timeout handling in create_itinerary.
 
 import asyncio
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
 
 from main import WorkflowTimeoutError, create_itinerary
 
@@ -55,17 +54,15 @@ class TestWorkflowTimeoutError:
 class TestTimeoutBehavior:
     """Tests for timeout behavior during workflow execution."""
 
-    @pytest.mark.asyncio
     async def test_asyncio_timeout_raises_correctly(self):
         """Test that asyncio.timeout raises TimeoutError correctly."""
         async def slow_operation():
             await asyncio.sleep(10)
 
         with pytest.raises(asyncio.TimeoutError):
-            async with asyncio.timeout(0.1):
+            async with asyncio.timeout(0.01):
                 await slow_operation()
 
-    @pytest.mark.asyncio
     async def test_asyncio_timeout_allows_fast_operations(self):
         """Test that asyncio.timeout allows fast operations to complete."""
         async def fast_operation():
@@ -77,20 +74,19 @@ class TestTimeoutBehavior:
 
         assert result == "completed"
 
-    @pytest.mark.asyncio
     async def test_timeout_with_async_generator(self):
         """Test timeout behavior with async generators (like runner.run_async)."""
         async def slow_generator():
             for i in range(10):
-                await asyncio.sleep(0.1)
                 yield i
+                await asyncio.sleep(1.0)
 
         results = []
         with pytest.raises(asyncio.TimeoutError):
-            async with asyncio.timeout(0.25):
+            async with asyncio.timeout(0.05):
                 async for item in slow_generator():
                     results.append(item)
 
-        # Should have collected some items before timeout
-        assert len(results) >= 1
-        assert len(results) <= 3
+        # The first item is yielded before any await, so exactly one item is
+        # collected however late the worker gets scheduled
+        assert results == [0]
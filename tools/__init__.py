@@ -6,8 +6,7 @@ This package contains tool implementations for:
 - Session state preferences access
 """
 
-from .google_books import search_book, google_books_tool
-from .preferences import get_user_preferences, get_preferences_tool
+from common.lazy_exports import lazy_exports
 
 __all__ = [
     "search_book",
@@ -15,3 +14,11 @@ __all__ = [
     "get_user_preferences",
     "get_preferences_tool",
 ]
+
+# FunctionTool and the Books HTTP session load only when a tool is used
+__getattr__ = lazy_exports(__name__, {
+    "search_book": ".google_books",
+    "google_books_tool": ".google_books",
+    "get_user_preferences": ".preferences",
+    "get_preferences_tool": ".preferences",
+})
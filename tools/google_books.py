@@ -4,9 +4,15 @@ Google Books API tool.
 Provides search functionality for books using the Google Books API.
 """
 
-import json
+import asyncio
+import functools
+import logging
+import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Optional
+from urllib3.util.retry import Retry
 
 from google.adk.tools import FunctionTool
 from models.book import BookInfo, BookMetadata
@@ -14,6 +20,47 @@ from common.logging import get_logger
 
 logger = get_logger(__name__)
 
+_VOLUMES_URL = "https://www.googleapis.com/books/v1/volumes"
+_BASE_PARAMS = {"printType": "books"}
+
+# Identical queries within this window reuse the cached API response
+_CACHE_TTL_SECONDS = 3600
+
+# Pooled keep-alive connections to the Books API, retrying throttling and
+# transient server errors with backoff
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+        ),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_volumes(query: str, max_results: int, ttl_bucket: int) -> bytes:
+    """
+    Fetch raw Google Books search results, cached per query.
+
+    ttl_bucket is the current TTL window (see search_books); it is part of the
+    cache key only so that entries expire. Failed requests raise and are not
+    cached.
+
+    Returns:
+        Raw JSON response body
+    """
+    params = {**_BASE_PARAMS, "q": query, "maxResults": max_results}
+
+    logger.debug("google_books_query", query=query, url=_VOLUMES_URL)
+    response = _SESSION.get(_VOLUMES_URL, params=params, timeout=10)
+    response.raise_for_status()
+
+    return response.content
+
 
 def search_books(
     title: str, author: Optional[str] = None, max_results: int = 5
@@ -27,29 +74,24 @@ def search_books(
         max_results: Maximum number of results
 
     Returns:
-        List of BookInfo objects
+        List of BookInfo objects (empty when neither title nor author is given)
     """
     logger.info("google_books_search", title=title, author=author)
 
-    try:
-        # Build query
-        query_parts = []
-        if title:
-            query_parts.append(f"intitle:{title}")
-        if author:
-            query_parts.append(f"inauthor:{author}")
+    # Build query
+    if not title:
+        if not author:
+            return []
+        query = f"inauthor:{author}"
+    elif author:
+        query = f"intitle:{title}+inauthor:{author}"
+    else:
+        query = f"intitle:{title}"
 
-        query = "+".join(query_parts)
-
-        # API request
-        url = "https://www.googleapis.com/books/v1/volumes"
-        params = {"q": query, "maxResults": max_results, "printType": "books"}
-
-        logger.debug("google_books_query", query=query, url=url)
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
+    try:
+        # API request (cached)
+        ttl_bucket = int(time.monotonic() // _CACHE_TTL_SECONDS)
+        data = orjson.loads(_fetch_volumes(query, max_results, ttl_bucket))
         items = data.get("items", [])
 
         # Parse results
@@ -84,16 +126,17 @@ def search_books(
 
         logger.info("google_books_results", count=len(results))
 
-        # Log all found books
-        for i, book in enumerate(results):
-            author_str = ", ".join(book.authors) if book.authors else "Unknown"
-            logger.debug(
-                "google_books_result_item",
-                index=i,
-                title=book.title,
-                author=author_str,
-                published_date=book.published_date or "N/A"
-            )
+        # Log all found books (skip the per-book formatting unless DEBUG is on)
+        if logger.is_enabled_for(logging.DEBUG):
+            for i, book in enumerate(results):
+                author_str = ", ".join(book.authors) if book.authors else "Unknown"
+                logger.debug(
+                    "google_books_result_item",
+                    index=i,
+                    title=book.title,
+                    author=author_str,
+                    published_date=book.published_date or "N/A"
+                )
 
         return results
 
@@ -102,7 +145,7 @@ def search_books(
         raise
 
 
-def search_book(title: str, author: str = "") -> str:
+async def search_book(title: str, author: str = "") -> str:
     """
     Search Google Books API and return Pydantic-validated book metadata.
 
@@ -119,14 +162,16 @@ def search_book(title: str, author: str = "") -> str:
     logger.info("search_book_called", title=title, author=author)
 
     try:
-        # Search for books
-        books = search_books(title=title, author=author or None, max_results=5)
+        # Search for books (blocking HTTP runs off the event loop)
+        books = await asyncio.to_thread(
+            search_books, title=title, author=author or None, max_results=5
+        )
 
         if not books:
             logger.warning("search_book_no_results", title=title, author=author)
-            return json.dumps(
+            return orjson.dumps(
                 {"error": "No books found", "query": {"title": title, "author": author}}
-            )
+            ).decode()
 
         # Select the first/best match
         selected = books[0]
@@ -149,7 +194,7 @@ def search_book(title: str, author: str = "") -> str:
 
     except Exception as e:
         logger.error("search_book_failed", error=str(e), error_type=type(e).__name__)
-        return json.dumps({"error": str(e), "type": type(e).__name__})
+        return orjson.dumps({"error": str(e), "type": type(e).__name__}).decode()
 
 
 # Create FunctionTool
@@ -4,9 +4,16 @@ Preferences tool for accessing user preferences from session state.
 Provides tools for agents to read user preferences stored in session state.
 """
 
-import json
+import orjson
 from google.adk.tools import FunctionTool, ToolContext
 
+# Response when no preferences are set; constant, so serialized once
+_NO_PREFERENCES_JSON = orjson.dumps({
+    "found": False,
+    "preferences": {},
+    "message": "No user preferences found. Using defaults."
+}).decode()
+
 
 def get_user_preferences(tool_context: ToolContext) -> str:
     """
@@ -20,17 +27,13 @@ def get_user_preferences(tool_context: ToolContext) -> str:
     """
     preferences = tool_context.state.get("user:preferences", {})
 
-    if preferences:
-        return json.dumps({
-            "found": True,
-            "preferences": preferences
-        })
-    else:
-        return json.dumps({
-            "found": False,
-            "preferences": {},
-            "message": "No user preferences found. Using defaults."
-        })
+    if not preferences:
+        return _NO_PREFERENCES_JSON
+
+    return orjson.dumps({
+        "found": True,
+        "preferences": preferences
+    }).decode()
 
 
 # Create FunctionTool